@@ -7,14 +7,16 @@ UI colors, and system paths.
 """
 
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Final
 
 
 # ─────────────────────────────────────────────
 # Platform Definition
 # ─────────────────────────────────────────────
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Platform:
     """
     Configuration for a single platform to limit.
@@ -35,21 +37,80 @@ class Platform:
     process_names: list[str] = field(default_factory=list)
     marker_tag: str = ""
     icon_emoji: str = "🚫"
+    # Derived strings cached by __post_init__ (declared so slots exist)
+    _marker_start: str = field(init=False, repr=False, compare=False)
+    _marker_end: str = field(init=False, repr=False, compare=False)
+    _usage_file_name: str = field(init=False, repr=False, compare=False)
+    _hosts_block: str = field(init=False, repr=False, compare=False)
+    _marker_re: "re.Pattern[bytes] | None" = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Platforms are immutable, so derived strings are formatted once
+        # here instead of on every property access (hosts-file rewrites
+        # hit the markers in tight loops). object.__setattr__ is needed
+        # because frozen=True forbids normal assignment.
+        object.__setattr__(
+            self, "_marker_start", f"# >>> DARKPAUSE-{self.marker_tag}-START <<<",
+        )
+        object.__setattr__(
+            self, "_marker_end", f"# >>> DARKPAUSE-{self.marker_tag}-END <<<",
+        )
+        object.__setattr__(self, "_usage_file_name", f"usage_{self.id}.json")
+        # Computed lazily by hosts_block — REDIRECT_IP is defined below
+        # the platform literals, so it isn't available here yet.
+        object.__setattr__(self, "_hosts_block", "")
+        object.__setattr__(self, "_marker_re", None)
 
     @property
     def marker_start(self) -> str:
         """Start marker for this platform's block in the hosts file."""
-        return f"# >>> DARKPAUSE-{self.marker_tag}-START <<<"
+        return self._marker_start
 
     @property
     def marker_end(self) -> str:
         """End marker for this platform's block in the hosts file."""
-        return f"# >>> DARKPAUSE-{self.marker_tag}-END <<<"
+        return self._marker_end
 
     @property
     def usage_file_name(self) -> str:
         """Filename for this platform's usage data."""
-        return f"usage_{self.id}.json"
+        return self._usage_file_name
+
+    @property
+    def hosts_block(self) -> str:
+        """
+        Complete hosts-file block section for this platform.
+
+        Built with a single join on first access and cached — hosts-file
+        rewrites then memcpy one string instead of re-formatting a line
+        per domain every time.
+        """
+        if not self._hosts_block:
+            lines: list[str] = [
+                self._marker_start,
+                f"# DarkPause - {self.display_name} block",
+                *(f"{REDIRECT_IP} {domain}" for domain in self.domains),
+                self._marker_end,
+            ]
+            object.__setattr__(self, "_hosts_block", "\n".join(lines))
+        return self._hosts_block
+
+    @property
+    def marker_re(self) -> "re.Pattern[bytes]":
+        """
+        Compiled bytes pattern matching this platform's whole marker span.
+
+        One regex traversal replaces separate start/end substring scans
+        when probing raw hosts bytes. Compiled on first use and cached.
+        """
+        if self._marker_re is None:
+            pattern = (
+                re.escape(self._marker_start.encode("utf-8"))
+                + b".*?"
+                + re.escape(self._marker_end.encode("utf-8"))
+            )
+            object.__setattr__(self, "_marker_re", re.compile(pattern, re.DOTALL))
+        return self._marker_re  # type: ignore[return-value]
 
 
 # ─────────────────────────────────────────────
@@ -105,6 +166,9 @@ YOUTUBE = Platform(
 ALL_PLATFORMS: list[Platform] = [INSTAGRAM, YOUTUBE]
 """List of all platforms managed by DarkPause."""
 
+_PLATFORM_BY_ID: dict[str, Platform] = {p.id: p for p in ALL_PLATFORMS}
+"""Index for O(1) platform lookups by ID. Built once at import."""
+
 
 def get_platform_by_id(platform_id: str) -> Platform | None:
     """
@@ -116,28 +180,25 @@ def get_platform_by_id(platform_id: str) -> Platform | None:
     Returns:
         Platform | None: The matching Platform, or None if not found.
     """
-    for platform in ALL_PLATFORMS:
-        if platform.id == platform_id:
-            return platform
-    return None
+    return _PLATFORM_BY_ID.get(platform_id)
 
 
 # ─────────────────────────────────────────────
 # Global Settings
 # ─────────────────────────────────────────────
-RESET_HOUR: int = 4
+RESET_HOUR: Final[int] = 4
 """Hour of the day (0-23) when all daily usage counters reset. Default: 4 AM."""
 
-WARNING_STEPS: list[int] = [5, 1]
+WARNING_STEPS: Final[tuple[int, ...]] = (5, 1)
 """Minutes remaining at which to send warning notifications (descending)."""
 
-WARNING_THRESHOLD_MINUTES: int = max(WARNING_STEPS)
+WARNING_THRESHOLD_MINUTES: Final[int] = max(WARNING_STEPS)
 """Derived: earliest warning threshold (for tray icon state)."""
 
-REDIRECT_IP: str = "127.0.0.1"
+REDIRECT_IP: Final[str] = "127.0.0.1"
 """IP address to redirect blocked domains to."""
 
-TIMER_TICK_SECONDS: int = 1
+TIMER_TICK_SECONDS: Final[int] = 1
 """How often the timer updates (in seconds)."""
 
 # ─────────────────────────────────────────────
@@ -159,34 +220,16 @@ APP_DATA_DIR: Path = Path(_appdata_base) / "DarkPause"
 APP_NAME: str = "DarkPause 🌌"
 """Display name of the application."""
 
-MAX_TOOLTIP_LENGTH: int = 127
+MAX_TOOLTIP_LENGTH: Final[int] = 127
 """Windows system tray tooltip max characters."""
 
-# ─────────────────────────────────────────────
-# Single Instance
-# ─────────────────────────────────────────────
-SINGLE_INSTANCE_PORT: int = 45678
-"""TCP port used to ensure only one instance runs at a time."""
-
 # ─────────────────────────────────────────────
 # Permanent Blocks (always blocked, no timer)
 # ─────────────────────────────────────────────
 PERMANENT_BLOCK_TAG: str = "PERMANENT"
 """Marker tag for permanent blocks in hosts file."""
 
-PERMANENT_BLOCK_DOMAINS: list[str] = [
-    # Social media (default blocks)
-    "instagram.com", "www.instagram.com",
-    "api.instagram.com", "i.instagram.com",
-    "graph.instagram.com", "l.instagram.com",
-    "static.cdninstagram.com", "scontent.cdninstagram.com",
-    "edge-chat.instagram.com",
-    "youtube.com", "www.youtube.com",
-    "m.youtube.com", "youtu.be",
-    "youtube-nocookie.com", "www.youtube-nocookie.com",
-    "youtubei.googleapis.com",
-    "yt3.ggpht.com", "yt3.googleusercontent.com",
-    "i.ytimg.com", "s.ytimg.com",
+_PERMANENT_CORE: frozenset[str] = frozenset({
     # Adult content — Major sites
     "pornhub.com", "www.pornhub.com",
     "xvideos.com", "www.xvideos.com",
@@ -225,8 +268,21 @@ PERMANENT_BLOCK_DOMAINS: list[str] = [
     "hentaihaven.xxx", "www.hentaihaven.xxx",
     "hanime.tv", "www.hanime.tv",
     "nhentai.net", "www.nhentai.net",
-]
-"""Domains permanently blocked via hosts file. No timer, no unblock."""
+})
+"""Always-blocked domains that don't belong to any timed platform."""
+
+PERMANENT_BLOCK_DOMAINS: frozenset[str] = frozenset().union(
+    _PERMANENT_CORE, *(p.domains for p in ALL_PLATFORMS),
+)
+"""Domains permanently blocked via hosts file. No timer, no unblock.
+
+Derived as the union of the core set with every platform's domain list,
+so platform additions can't drift out of sync and duplicates are
+impossible. Frozenset so membership checks hash in O(1).
+"""
+
+PERMANENT_BLOCK_DOMAINS_SORTED: tuple[str, ...] = tuple(sorted(PERMANENT_BLOCK_DOMAINS))
+"""Deterministic iteration order for hosts-file emission."""
 
 # ─────────────────────────────────────────────
 # Allowlist Mode (Deep Work)
@@ -252,7 +308,7 @@ ALLOWLIST_DOMAINS: list[str] = [
 ]
 """Domains allowed during Allowlist / Deep Work mode. Everything else is blocked."""
 
-ALLOWLIST_REFRESH_SECONDS: int = 300
+ALLOWLIST_REFRESH_SECONDS: Final[int] = 300
 """How often to re-resolve allowlist domain IPs (seconds). CDN IPs change."""
 
 # ─────────────────────────────────────────────
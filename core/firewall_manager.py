@@ -21,10 +21,11 @@ an acceptable trade-off for a digital discipline tool.
 """
 
 import logging
-import socket
-import subprocess
-import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import threading
 
 logger = logging.getLogger(__name__)
 
@@ -43,22 +44,43 @@ _PUBLIC_DNS_SERVERS: list[str] = [
     "149.112.112.112", # Quad9 secondary
 ]
 
+_PUBLIC_DNS_SERVERS_CSV: str = ",".join(_PUBLIC_DNS_SERVERS)
+"""Precomputed netsh remoteip= value — constant, so joined once at import."""
+
 _DNS_RULE_NAME: str = f"{_RULE_PREFIX}-DNS-Lock"
 _DOT_RULE_NAME: str = f"{_RULE_PREFIX}-DoT-Lock"
 
+# Static command prefixes — built once so hot paths only concatenate
+_ADD_RULE_BASE: list[str] = ["advfirewall", "firewall", "add", "rule"]
+_DELETE_RULE_BASE: list[str] = ["advfirewall", "firewall", "delete", "rule"]
+
 
-def _run_netsh(args: list[str]) -> tuple[bool, str]:
+def _run_netsh(args: list[str], capture: bool = True) -> tuple[bool, str]:
     """
     Execute a netsh command and return the result.
 
     Args:
         args: Arguments to pass to netsh.
+        capture: If False, discard output via DEVNULL — skips pipe
+            creation and decoding when callers only need the exit bit.
 
     Returns:
-        tuple[bool, str]: (success, combined stdout+stderr output).
+        tuple[bool, str]: (success, combined stdout+stderr output;
+        empty string when capture is False).
     """
+    import subprocess
+
     cmd: list[str] = ["netsh"] + args
     try:
+        if not capture:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+                timeout=_SUBPROCESS_TIMEOUT,
+            )
+            return result.returncode == 0, ""
         result = subprocess.run(
             cmd,
             capture_output=True,
@@ -76,15 +98,84 @@ def _run_netsh(args: list[str]) -> tuple[bool, str]:
         return False, str(e)
 
 
+def _run_netsh_script(commands: list[list[str]]) -> tuple[bool, str]:
+    """
+    Execute several netsh commands in a single process via `netsh -f`.
+
+    Spawning netsh once per rule costs ~50-200 ms each (process creation
+    plus advfirewall init). Writing all commands to a script file and
+    running `netsh -f script.txt` amortizes that cost across the batch.
+
+    Args:
+        commands: List of netsh argument lists (without the "netsh" prefix).
+
+    Returns:
+        tuple[bool, str]: (success, combined stdout+stderr output).
+    """
+    import os
+    import tempfile
+
+    script: str = "\n".join(" ".join(cmd) for cmd in commands) + "\n"
+    tmp_path: str = ""
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".txt", delete=False, encoding="ascii",
+        ) as tmp:
+            tmp_path = tmp.name
+            tmp.write(script)
+        return _run_netsh(["-f", tmp_path])
+    except Exception as e:
+        logger.error(f"netsh script execution failed: {e}")
+        return False, str(e)
+    finally:
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
 def _delete_rule(name: str) -> bool:
-    """Delete a firewall rule by name (idempotent, no error on missing)."""
-    success, _ = _run_netsh([
-        "advfirewall", "firewall", "delete", "rule",
-        f"name={name}",
-    ])
+    """Delete a firewall rule by name (tolerates missing rules)."""
+    success, _ = _run_netsh(
+        [*_DELETE_RULE_BASE, f"name={name}"], capture=False,
+    )
     return success
 
 
+def _delete_rules_parallel(names: list[str]) -> None:
+    """
+    Delete several firewall rules concurrently.
+
+    Independent netsh deletes don't conflict, so launching them all at
+    once cuts cleanup from N netsh latencies to roughly one. Idempotent —
+    missing rules are ignored.
+
+    Args:
+        names: Rule names to delete.
+    """
+    import subprocess
+
+    procs: list[subprocess.Popen] = []
+    for name in names:
+        try:
+            procs.append(subprocess.Popen(
+                ["netsh", "advfirewall", "firewall", "delete", "rule", f"name={name}"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            ))
+        except Exception as e:
+            logger.warning(f"Failed to launch rule delete for {name}: {e}")
+
+    for proc in procs:
+        try:
+            proc.wait(timeout=_SUBPROCESS_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.warning("netsh rule delete timed out.")
+            proc.kill()
+
+
 # ─── Public API ───
 
 
@@ -101,44 +192,45 @@ def block_alternative_dns() -> bool:
     Returns:
         bool: True if at least the DNS IP rule was applied successfully.
     """
-    # Clean up existing rules first (idempotent)
-    _delete_rule(_DNS_RULE_NAME)
-    _delete_rule(_DOT_RULE_NAME)
-
-    ip_list: str = ",".join(_PUBLIC_DNS_SERVERS)
-
-    # Rule 1: Block known public DNS server IPs
-    dns_ok, dns_out = _run_netsh([
-        "advfirewall", "firewall", "add", "rule",
-        f"name={_DNS_RULE_NAME}",
-        "dir=out", "action=block",
-        "protocol=any",
-        f"remoteip={ip_list}",
-        "enable=yes",
+    global _dns_locked_cache
+    _dns_locked_cache = None
+
+    # Clean up existing rules first (idempotent). Deletes run separately
+    # from the add batch: on a first run they fail with "No rules match",
+    # and folding them into the `netsh -f` script would poison its exit
+    # status (and possibly abort the adds).
+    _delete_rules_parallel([_DNS_RULE_NAME, _DOT_RULE_NAME])
+
+    # Batch both rule adds into a single netsh process.
+    dns_ok, dns_out = _run_netsh_script([
+        # Rule 1: Block known public DNS server IPs
+        [
+            *_ADD_RULE_BASE,
+            f"name={_DNS_RULE_NAME}",
+            "dir=out", "action=block",
+            "protocol=any",
+            f"remoteip={_PUBLIC_DNS_SERVERS_CSV}",
+            "enable=yes",
+        ],
+        # Rule 2: Block DNS-over-TLS (port 853) to ANY server
+        [
+            *_ADD_RULE_BASE,
+            f"name={_DOT_RULE_NAME}",
+            "dir=out", "action=block",
+            "protocol=tcp",
+            "remoteport=853",
+            "enable=yes",
+        ],
     ])
 
     if dns_ok:
         logger.info(
-            f"🔒 DNS lock: blocked {len(_PUBLIC_DNS_SERVERS)} public DNS servers."
+            f"🔒 DNS lock: blocked {len(_PUBLIC_DNS_SERVERS)} public DNS servers "
+            f"+ outbound port 853 (DoT)."
         )
     else:
         logger.warning(f"⚠️ DNS lock failed: {dns_out}")
 
-    # Rule 2: Block DNS-over-TLS (port 853) to ANY server
-    dot_ok, dot_out = _run_netsh([
-        "advfirewall", "firewall", "add", "rule",
-        f"name={_DOT_RULE_NAME}",
-        "dir=out", "action=block",
-        "protocol=tcp",
-        "remoteport=853",
-        "enable=yes",
-    ])
-
-    if dot_ok:
-        logger.info("🔒 DoT lock: blocked outbound port 853.")
-    else:
-        logger.warning(f"⚠️ DoT lock failed: {dot_out}")
-
     return dns_ok
 
 
@@ -152,6 +244,9 @@ def unblock_alternative_dns() -> bool:
     Returns:
         bool: True if rules were removed successfully.
     """
+    global _dns_locked_cache
+    _dns_locked_cache = None
+
     dns_ok: bool = _delete_rule(_DNS_RULE_NAME)
     dot_ok: bool = _delete_rule(_DOT_RULE_NAME)
 
@@ -160,18 +255,38 @@ def unblock_alternative_dns() -> bool:
     return dns_ok or dot_ok
 
 
+# Short-lived cache for is_dns_locked: (result, time.monotonic() timestamp).
+# Firewall rules only change via this module, so a few seconds of staleness
+# is safe and avoids a netsh spawn on every poll.
+_DNS_LOCKED_CACHE_SECONDS: float = 5.0
+_dns_locked_cache: tuple[bool, float] | None = None
+
+
 def is_dns_locked() -> bool:
     """
     Check if the DNS lock firewall rule is currently active.
 
+    The result is memoized for a few seconds; mutations via
+    block_/unblock_alternative_dns invalidate the cache.
+
     Returns:
         bool: True if the DNS lock rule exists in Windows Firewall.
     """
-    success, output = _run_netsh([
-        "advfirewall", "firewall", "show", "rule",
-        f"name={_DNS_RULE_NAME}",
-    ])
-    return success and _DNS_RULE_NAME in output
+    global _dns_locked_cache
+    import time
+
+    if (
+        _dns_locked_cache is not None
+        and time.monotonic() - _dns_locked_cache[1] < _DNS_LOCKED_CACHE_SECONDS
+    ):
+        return _dns_locked_cache[0]
+
+    success, output = _run_netsh(
+        ["advfirewall", "firewall", "show", "rule", f"name={_DNS_RULE_NAME}"]
+    )
+    result: bool = success and _DNS_RULE_NAME in output
+    _dns_locked_cache = (result, time.monotonic())
+    return result
 
 
 def cleanup_all_rules() -> None:
@@ -180,8 +295,7 @@ def cleanup_all_rules() -> None:
 
     Use this during uninstall to leave the system clean.
     """
-    _delete_rule(_DNS_RULE_NAME)
-    _delete_rule(_DOT_RULE_NAME)
+    _delete_rules_parallel([_DNS_RULE_NAME, _DOT_RULE_NAME])
     disable_allowlist_mode()
     logger.info("🧹 All DarkPause firewall rules cleaned up.")
 
@@ -191,9 +305,27 @@ def cleanup_all_rules() -> None:
 _ALLOWLIST_BLOCK_ALL_RULE: str = f"{_RULE_PREFIX}-Allowlist-BlockAll"
 _ALLOWLIST_ALLOW_PREFIX: str = f"{_RULE_PREFIX}-Allowlist-Allow"
 _allowlist_active: bool = False
-_allowlist_thread: threading.Thread | None = None
-_allowlist_stop_event: threading.Event = threading.Event()
-
+_allowlist_timer: "threading.Timer | None" = None
+
+# Serializes rule mutation between a refresh tick and enable/disable —
+# a tick past its active check could otherwise re-install the block-all
+# rule after disable already deleted it.
+_allowlist_lock: "threading.Lock | None" = None
+
+
+def _get_allowlist_lock() -> "threading.Lock":
+    """Lazy-create the allowlist mutation lock (defers the threading import)."""
+    global _allowlist_lock
+    if _allowlist_lock is None:
+        import threading
+        _allowlist_lock = threading.Lock()
+    return _allowlist_lock
+
+# netsh remoteip= has a command-line length ceiling (~32 KB); chunking keeps
+# each allow rule well below it even when CDNs resolve to many IPs.
+_ALLOWLIST_CHUNK_SIZE: int = 500
+_allow_rule_count: int = 1
+"""Number of numbered allow rules currently applied (for cleanup)."""
 # State file for crash recovery
 _ALLOWLIST_STATE_FILE: Path | None = None
 
@@ -208,12 +340,17 @@ def _get_allowlist_state_file() -> Path:
 
 
 def _persist_allowlist_state(active: bool) -> None:
-    """Persist allowlist active flag to disk for crash recovery."""
+    """
+    Persist allowlist active flag to disk for crash recovery.
+
+    The file stores the number of numbered allow rules, so a post-crash
+    cleanup knows how many chunked rules to delete.
+    """
     try:
         state_file: Path = _get_allowlist_state_file()
         if active:
             state_file.parent.mkdir(parents=True, exist_ok=True)
-            state_file.write_text("1", encoding="utf-8")
+            state_file.write_text(str(max(_allow_rule_count, 1)), encoding="utf-8")
         else:
             state_file.unlink(missing_ok=True)
     except Exception as e:
@@ -231,35 +368,71 @@ def cleanup_orphaned_allowlist() -> None:
         state_file: Path = _get_allowlist_state_file()
         if state_file.exists():
             logger.warning("⚠️ Orphaned allowlist rules detected. Cleaning up...")
-            _delete_rule(_ALLOWLIST_BLOCK_ALL_RULE)
-            for suffix in ["0", "local"]:
-                _delete_rule(f"{_ALLOWLIST_ALLOW_PREFIX}-{suffix}")
+            try:
+                rule_count: int = max(1, int(state_file.read_text(encoding="utf-8")))
+            except (ValueError, OSError):
+                rule_count = 1
+            _delete_rules_parallel(
+                [_ALLOWLIST_BLOCK_ALL_RULE, f"{_ALLOWLIST_ALLOW_PREFIX}-local"]
+                + [f"{_ALLOWLIST_ALLOW_PREFIX}-{i}" for i in range(rule_count)]
+            )
             state_file.unlink(missing_ok=True)
             logger.info("✅ Orphaned allowlist rules cleaned.")
     except Exception as e:
         logger.warning(f"Orphaned allowlist cleanup error: {e}")
 
 
-def _resolve_domain_ips(domain: str) -> set[str]:
+# TTL-bounded DNS cache: {domain: (ips, expiry via time.monotonic())}
+_DNS_CACHE_TTL_SECONDS: int = 60
+_dns_cache: dict[str, tuple[tuple[str, ...], float]] = {}
+
+# IP set from the last successful rule application — lets the refresh
+# loop skip netsh entirely when nothing resolved differently.
+_last_applied_ips: frozenset[str] | None = None
+
+
+def _resolve_domain_ips(domain: str) -> tuple[str, ...]:
     """
     Resolve a domain name to its IP addresses.
 
+    Results are cached for a short TTL to avoid redundant lookups
+    within and across refresh cycles. Returns a tuple so callers can
+    update their target set in place without a throwaway set per call.
+
     Args:
         domain: The domain name to resolve.
 
     Returns:
-        set[str]: Set of resolved IPv4 addresses.
+        tuple[str, ...]: Resolved IPv4/IPv6 addresses (empty on failure).
     """
-    ips: set[str] = set()
+    import time
+
+    cached = _dns_cache.get(domain)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
+    import socket
+
     try:
-        results = socket.getaddrinfo(domain, None, socket.AF_INET)
-        for result in results:
-            ips.add(result[4][0])
+        # AF_UNSPEC returns both A and AAAA records in one resolver call;
+        # SOCK_STREAM dedupes the TCP/UDP row duplication. IPv6-only CDN
+        # endpoints would otherwise slip past the allowlist block-all rule
+        # (netsh remoteip= accepts mixed v4/v6).
+        ips: tuple[str, ...] = tuple(
+            result[4][0]
+            for result in socket.getaddrinfo(
+                domain, None,
+                socket.AF_UNSPEC, socket.SOCK_STREAM, 0,
+                socket.AI_NUMERICSERV,
+            )
+        )
+        _dns_cache[domain] = (ips, time.monotonic() + _DNS_CACHE_TTL_SECONDS)
+        return ips
     except socket.gaierror as e:
         logger.debug(f"Could not resolve {domain}: {e}")
     except Exception as e:
         logger.warning(f"DNS resolution error for {domain}: {e}")
-    return ips
+    return ()
 
 
 def _get_all_allowed_ips(domains: list[str]) -> set[str]:
@@ -274,17 +447,28 @@ def _get_all_allowed_ips(domains: list[str]) -> set[str]:
     Returns:
         set[str]: Combined set of all allowed IPs.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
     # Essential IPs that must always be reachable
     allowed: set[str] = {
         "127.0.0.1",       # localhost
+        "::1",             # IPv6 loopback
         "255.255.255.255", # broadcast
     }
 
-    for domain in domains:
-        resolved: set[str] = _resolve_domain_ips(domain)
-        if resolved:
-            logger.debug(f"Resolved {domain} -> {resolved}")
-            allowed.update(resolved)
+    if not domains:
+        return allowed
+
+    # DNS lookups are I/O-bound (getaddrinfo releases the GIL), so firing
+    # them concurrently cuts total latency from sum to max of resolutions.
+    with ThreadPoolExecutor(
+        max_workers=min(32, len(domains)),
+        thread_name_prefix="allowlist-dns",
+    ) as executor:
+        for domain, resolved in zip(domains, executor.map(_resolve_domain_ips, domains)):
+            if resolved:
+                logger.debug(f"Resolved {domain} -> {resolved}")
+                allowed.update(resolved)
 
     return allowed
 
@@ -299,48 +483,51 @@ def _apply_allowlist_rules(allowed_ips: set[str]) -> bool:
     Returns:
         bool: True if block-all rule was applied successfully.
     """
-    # Remove existing allowlist rules first
-    _delete_rule(_ALLOWLIST_BLOCK_ALL_RULE)
-    # Delete known allow rules (fast, no probing loop)
-    for suffix in ["0", "local"]:
-        _delete_rule(f"{_ALLOWLIST_ALLOW_PREFIX}-{suffix}")
+    global _allow_rule_count
+
+    # Remove existing allowlist rules first. These deletes are expected
+    # to fail on a first run ("No rules match"), so they must not share
+    # an exit status with the adds — a false batch failure here would
+    # leave Block-All-Outbound applied while reporting defeat upstream.
+    _delete_rules_parallel(
+        [_ALLOWLIST_BLOCK_ALL_RULE, f"{_ALLOWLIST_ALLOW_PREFIX}-local"]
+        + [
+            f"{_ALLOWLIST_ALLOW_PREFIX}-{i}"
+            for i in range(max(_allow_rule_count, 1))
+        ]
+    )
+
+    commands: list[list[str]] = []
 
     # Create Block All Outbound rule
-    block_ok, block_out = _run_netsh([
-        "advfirewall", "firewall", "add", "rule",
+    commands.append([
+        *_ADD_RULE_BASE,
         f"name={_ALLOWLIST_BLOCK_ALL_RULE}",
         "dir=out", "action=block",
         "protocol=any",
         "enable=yes",
     ])
 
-    if not block_ok:
-        logger.error(f"Failed to create block-all rule: {block_out}")
-        return False
-
-    logger.info("🚫 Allowlist: Block All Outbound rule applied.")
-
-    # Create Allow rules for each IP
+    # Create Allow rules, chunked to respect netsh's command-length limit.
+    # netsh supports comma-separated IPs in a single rule.
     ip_list: list[str] = sorted(allowed_ips)
-    # netsh supports comma-separated IPs in a single rule
-    if ip_list:
-        ip_csv: str = ",".join(ip_list)
-        allow_ok, allow_out = _run_netsh([
-            "advfirewall", "firewall", "add", "rule",
-            f"name={_ALLOWLIST_ALLOW_PREFIX}-0",
+    chunks: list[list[str]] = [
+        ip_list[i:i + _ALLOWLIST_CHUNK_SIZE]
+        for i in range(0, len(ip_list), _ALLOWLIST_CHUNK_SIZE)
+    ]
+    for i, chunk in enumerate(chunks):
+        commands.append([
+            *_ADD_RULE_BASE,
+            f"name={_ALLOWLIST_ALLOW_PREFIX}-{i}",
             "dir=out", "action=allow",
             "protocol=any",
-            f"remoteip={ip_csv}",
+            f"remoteip={','.join(chunk)}",
             "enable=yes",
         ])
-        if allow_ok:
-            logger.info(f"✅ Allowlist: Allowed {len(ip_list)} IPs.")
-        else:
-            logger.warning(f"Failed to create allow rule: {allow_out}")
 
     # Always allow local network (DHCP, gateway, etc.)
-    _run_netsh([
-        "advfirewall", "firewall", "add", "rule",
+    commands.append([
+        *_ADD_RULE_BASE,
         f"name={_ALLOWLIST_ALLOW_PREFIX}-local",
         "dir=out", "action=allow",
         "protocol=any",
@@ -348,12 +535,51 @@ def _apply_allowlist_rules(allowed_ips: set[str]) -> bool:
         "enable=yes",
     ])
 
+    # One netsh process for the whole add batch
+    batch_ok, batch_out = _run_netsh_script(commands)
+
+    if not batch_ok:
+        logger.error(f"Failed to apply allowlist rules: {batch_out}")
+        return False
+
+    global _last_applied_ips
+    _last_applied_ips = frozenset(allowed_ips)
+    _allow_rule_count = max(len(chunks), 1)
+
+    logger.info(
+        f"🚫 Allowlist: Block All Outbound applied, {len(ip_list)} IPs allowed "
+        f"across {len(chunks)} rule(s)."
+    )
     return True
 
 
-def _allowlist_refresh_loop(domains: list[str], interval: int) -> None:
+def _schedule_allowlist_refresh(domains: list[str], interval: int) -> None:
+    """
+    Schedule the next allowlist IP refresh via a one-shot Timer.
+
+    A Timer holds no long-lived thread stack between ticks (vs a
+    dedicated loop thread parked on Event.wait), and cancellation on
+    disable is a simple .cancel() with no join race.
+
+    Args:
+        domains: List of domain names to resolve.
+        interval: Seconds until the next refresh.
     """
-    Background loop that periodically re-resolves allowlist IPs.
+    global _allowlist_timer
+
+    import threading
+
+    _allowlist_timer = threading.Timer(
+        interval, _allowlist_refresh_tick, args=(domains, interval),
+    )
+    _allowlist_timer.daemon = True
+    _allowlist_timer.name = "allowlist-refresh"
+    _allowlist_timer.start()
+
+
+def _allowlist_refresh_tick(domains: list[str], interval: int) -> None:
+    """
+    Re-resolve allowlist IPs, update rules if changed, and reschedule.
 
     CDN IPs change frequently, so we need to keep rules updated.
 
@@ -361,13 +587,25 @@ def _allowlist_refresh_loop(domains: list[str], interval: int) -> None:
         domains: List of domain names to resolve.
         interval: Seconds between refresh cycles.
     """
-    while not _allowlist_stop_event.is_set():
-        _allowlist_stop_event.wait(timeout=interval)
-        if _allowlist_stop_event.is_set():
-            break
-        logger.debug("🔄 Allowlist: refreshing domain IPs...")
-        allowed_ips: set[str] = _get_all_allowed_ips(domains)
-        _apply_allowlist_rules(allowed_ips)
+    if not _allowlist_active:
+        return
+
+    logger.debug("🔄 Allowlist: refreshing domain IPs...")
+    # DNS resolution is slow (seconds) and rule-neutral, so it runs
+    # outside the lock; only the rule mutation is serialized.
+    allowed_ips: set[str] = _get_all_allowed_ips(domains)
+
+    with _get_allowlist_lock():
+        # Re-check under the lock: disable_allowlist_mode may have torn
+        # the rules down while we were resolving, and re-applying them
+        # here would block all outbound traffic with the mode off.
+        if not _allowlist_active:
+            return
+        if frozenset(allowed_ips) == _last_applied_ips:
+            logger.debug("Allowlist: resolved IPs unchanged, skipping rule rewrite.")
+        else:
+            _apply_allowlist_rules(allowed_ips)
+        _schedule_allowlist_refresh(domains, interval)
 
 
 def enable_allowlist_mode() -> bool:
@@ -375,13 +613,13 @@ def enable_allowlist_mode() -> bool:
     Enable Allowlist / Deep Work mode.
 
     Blocks ALL outbound internet traffic except for domains in
-    ALLOWLIST_DOMAINS. Starts a background thread to periodically
-    re-resolve domain IPs.
+    ALLOWLIST_DOMAINS. Schedules a periodic Timer to re-resolve
+    domain IPs.
 
     Returns:
         bool: True if allowlist mode was enabled successfully.
     """
-    global _allowlist_active, _allowlist_thread
+    global _allowlist_active
 
     from core.config import ALLOWLIST_DOMAINS, ALLOWLIST_REFRESH_SECONDS
 
@@ -391,24 +629,14 @@ def enable_allowlist_mode() -> bool:
 
     logger.info("🌐 Enabling Allowlist / Deep Work mode...")
 
-    # BUG-3 FIX: Clear stop event BEFORE applying rules, so the refresh
-    # thread always starts clean even if a previous enable/disable cycle
-    # left the event in a set state.
-    _allowlist_stop_event.clear()
-
     allowed_ips: set[str] = _get_all_allowed_ips(ALLOWLIST_DOMAINS)
-    if not _apply_allowlist_rules(allowed_ips):
-        return False
+    with _get_allowlist_lock():
+        if not _apply_allowlist_rules(allowed_ips):
+            return False
 
-    _allowlist_active = True
+        _allowlist_active = True
 
-    _allowlist_thread = threading.Thread(
-        target=_allowlist_refresh_loop,
-        args=(ALLOWLIST_DOMAINS, ALLOWLIST_REFRESH_SECONDS),
-        daemon=True,
-        name="allowlist-refresh",
-    )
-    _allowlist_thread.start()
+        _schedule_allowlist_refresh(ALLOWLIST_DOMAINS, ALLOWLIST_REFRESH_SECONDS)
 
     logger.info("✅ Allowlist mode ACTIVE. Only allowed domains are reachable.")
     _persist_allowlist_state(active=True)
@@ -419,23 +647,32 @@ def disable_allowlist_mode() -> None:
     """
     Disable Allowlist / Deep Work mode.
 
-    Removes all allowlist firewall rules and stops the refresh thread.
+    Removes all allowlist firewall rules and cancels the refresh timer.
     Internet access is fully restored.
     """
-    global _allowlist_active, _allowlist_thread
-
-    _allowlist_stop_event.set()
-    if _allowlist_thread and _allowlist_thread.is_alive():
-        _allowlist_thread.join(timeout=5)
-    _allowlist_thread = None
-
-    _delete_rule(_ALLOWLIST_BLOCK_ALL_RULE)
-    # Clean up allow rules
-    for suffix in ["0", "local"]:
-        _delete_rule(f"{_ALLOWLIST_ALLOW_PREFIX}-{suffix}")
+    global _allowlist_active, _allowlist_timer, _last_applied_ips
+
+    # Taking the lock waits out an in-flight refresh tick (which holds
+    # it across its netsh writes), so the deletes below can't be undone
+    # by a tick that passed its active check before we flipped the flag.
+    with _get_allowlist_lock():
+        _last_applied_ips = None
+        _allowlist_active = False
+
+        if _allowlist_timer is not None:
+            _allowlist_timer.cancel()
+            _allowlist_timer = None
+
+        # Remove block-all + all chunked allow rules concurrently
+        _delete_rules_parallel(
+            [_ALLOWLIST_BLOCK_ALL_RULE, f"{_ALLOWLIST_ALLOW_PREFIX}-local"]
+            + [
+                f"{_ALLOWLIST_ALLOW_PREFIX}-{i}"
+                for i in range(max(_allow_rule_count, 1))
+            ]
+        )
 
-    _allowlist_active = False
-    _persist_allowlist_state(active=False)
+        _persist_allowlist_state(active=False)
     logger.info("🔓 Allowlist mode DISABLED. Full internet restored.")
 
 
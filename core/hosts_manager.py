@@ -10,22 +10,55 @@ encoding for Windows compatibility.
 """
 
 import logging
+import mmap
+import os
+import re
+import shutil
+import stat
 import subprocess
+import tempfile
 import threading
 from pathlib import Path
 
-from .config import HOSTS_FILE_PATH, REDIRECT_IP, Platform
+from .config import (
+    APP_DATA_DIR,
+    HOSTS_FILE_PATH,
+    PERMANENT_BLOCK_TAG,
+    REDIRECT_IP,
+    Platform,
+)
+from .permanent_blocks import get_all_permanent_domains
 
 logger = logging.getLogger(__name__)
 
 # Thread lock for hosts file operations
 _hosts_lock: threading.Lock = threading.Lock()
 
+# Cached hosts content keyed by (st_mtime_ns, st_size). Read by callers
+# both with and without _hosts_lock held, so the cache is a single tuple
+# that is read/replaced atomically (GIL) instead of lock-guarded.
+_hosts_cache: tuple[int, int, str] | None = None
+
+# Permanent-block markers, formatted once at import
+_PERM_MARKER_START: str = f"# >>> DARKPAUSE-{PERMANENT_BLOCK_TAG}-START <<<"
+_PERM_MARKER_END: str = f"# >>> DARKPAUSE-{PERMANENT_BLOCK_TAG}-END <<<"
+
+# Joined permanent block section keyed by hash of the domain tuple, so
+# repeated applies with an unchanged domain list skip the rebuild.
+_perm_section_cache: tuple[int, str] | None = None
+
+_REDIRECT_LINE_RE: re.Pattern[str] = re.compile(
+    rf"^{re.escape(REDIRECT_IP)}\s+(\S+)", re.MULTILINE,
+)
+
+
+def _domain_fingerprint(content: str) -> int:
+    """Hash of the set of redirected domains in the given hosts content."""
+    return hash(frozenset(_REDIRECT_LINE_RE.findall(content)))
+
 
 def _remove_readonly(path: Path = HOSTS_FILE_PATH) -> None:
     """Remove read-only attribute from hosts file if present."""
-    import os
-    import stat
     try:
         current = os.stat(path).st_mode
         if not (current & stat.S_IWRITE):
@@ -36,12 +69,10 @@ def _remove_readonly(path: Path = HOSTS_FILE_PATH) -> None:
 
 def _ensure_hosts_backup() -> None:
     """Create a backup of the hosts file if one doesn't exist."""
-    from .config import APP_DATA_DIR
     backup_path = APP_DATA_DIR / "hosts.backup"
     if not backup_path.exists():
         try:
             APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
-            import shutil
             shutil.copy2(HOSTS_FILE_PATH, backup_path)
             logger.info(f"📋 Hosts file backup created at: {backup_path}")
         except Exception as e:
@@ -49,8 +80,31 @@ def _ensure_hosts_backup() -> None:
 
 
 def _read_hosts_file() -> str:
-    """Read the current contents of the Windows hosts file."""
-    return HOSTS_FILE_PATH.read_text(encoding="utf-8-sig")
+    """
+    Read the current contents of the Windows hosts file.
+
+    Returns a cached copy when the file's (mtime_ns, size) is unchanged,
+    so the periodic integrity checks cost one os.stat instead of
+    re-reading and decoding the whole file every time.
+    """
+    global _hosts_cache
+    st: os.stat_result = os.stat(HOSTS_FILE_PATH)
+    cached = _hosts_cache
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    # Raw os-level read: one open/read/close with no TextIOWrapper or
+    # universal-newline machinery between us and the bytes. The size
+    # from the stat above makes the first read() grab the whole file.
+    fd: int = os.open(HOSTS_FILE_PATH, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks: list[bytes] = []
+        while chunk := os.read(fd, max(st.st_size, 1 << 16)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    content: str = b"".join(chunks).decode("utf-8-sig").replace("\r\n", "\n")
+    _hosts_cache = (st.st_mtime_ns, st.st_size, content)
+    return content
 
 
 def _write_hosts_file(content: str) -> None:
@@ -58,15 +112,24 @@ def _write_hosts_file(content: str) -> None:
     Write content to the Windows hosts file atomically.
 
     FIX-8: Uses tempfile.mkstemp + os.replace for true atomic writes,
-    preventing corruption if the process is killed mid-write.
-    Falls back to direct write if atomic write fails.
+    preventing corruption if the process is killed mid-write. The parent
+    directory is fsync'd after the rename (non-Windows) so the atomic
+    path is fully durable, which let the old non-atomic fallback write
+    go away; failures now propagate to the caller's error handling.
     """
-    import os
-    import tempfile
+    global _hosts_cache
 
     _ensure_hosts_backup()
     _remove_readonly()
 
+    # Encode once up front (utf-8-sig == BOM + utf-8) and write raw
+    # bytes, skipping the text-IO wrapper and its per-chunk encoder.
+    # Text mode used to translate newlines, so do that here too.
+    newline_content: str = (
+        content.replace("\n", os.linesep) if os.linesep != "\n" else content
+    )
+    data: bytes = ("\ufeff" + newline_content).encode("utf-8")
+
     fd: int = -1
     tmp_path: str = ""
     try:
@@ -75,21 +138,29 @@ def _write_hosts_file(content: str) -> None:
             prefix=".hosts_",
             suffix=".tmp",
         )
-        with os.fdopen(fd, "w", encoding="utf-8-sig") as f:
-            fd = -1  # os.fdopen takes ownership
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+        os.close(fd)
+        fd = -1
         os.replace(tmp_path, str(HOSTS_FILE_PATH))
         tmp_path = ""
+        if os.name != "nt":
+            # Durable rename needs the directory entry flushed too.
+            # Windows ReplaceFile semantics make this unnecessary there.
+            dirfd: int = os.open(str(HOSTS_FILE_PATH.parent), os.O_DIRECTORY)
+            try:
+                os.fsync(dirfd)
+            finally:
+                os.close(dirfd)
+        st = os.stat(HOSTS_FILE_PATH)
+        _hosts_cache = (st.st_mtime_ns, st.st_size, content)
         logger.info("Hosts file updated successfully (atomic).")
     except Exception as e:
-        logger.warning(f"Atomic write failed ({e}), falling back to direct write.")
-        try:
-            HOSTS_FILE_PATH.write_text(content, encoding="utf-8-sig")
-            logger.info("Hosts file updated successfully (fallback).")
-        except Exception as fallback_err:
-            logger.error(f"Fallback write also failed: {fallback_err}")
+        _hosts_cache = None
+        logger.error(f"Atomic hosts write failed: {e}")
+        raise
     finally:
         if tmp_path and os.path.exists(tmp_path):
             try:
@@ -104,43 +175,49 @@ def _write_hosts_file(content: str) -> None:
 
 
 def _build_block_section(platform: Platform) -> str:
-    """Build the hosts file block section for a platform."""
-    lines: list[str] = [platform.marker_start]
-    lines.append(f"# DarkPause - {platform.display_name} block")
-    for domain in platform.domains:
-        lines.append(f"{REDIRECT_IP} {domain}")
-    lines.append(platform.marker_end)
-    return "\n".join(lines)
+    """Get the hosts file block section for a platform (cached on Platform)."""
+    return platform.hosts_block
 
 
 def _remove_existing_block(content: str, platform: Platform) -> str:
-    """Remove existing block for a platform from hosts content."""
-    result: list[str] = []
-    inside_block: bool = False
-    skipped_lines: list[str] = []
-
-    for line in content.splitlines():
-        if platform.marker_start in line:
-            inside_block = True
-            skipped_lines = []
-            continue
-        if inside_block and platform.marker_end in line:
-            inside_block = False
-            continue
-        if inside_block:
-            skipped_lines.append(line)
-        else:
-            result.append(line)
-
-    # BUG-03 FIX: If end marker missing, restore buffered lines
-    if inside_block and skipped_lines:
+    """
+    Remove existing block for a platform from hosts content.
+
+    Locates the markers with C-level str.find and splices the section out
+    with two slice copies instead of iterating every line in Python —
+    on a large hosts file this is the difference between O(N) interpreter
+    work and a couple of memchr scans.
+    """
+    start: int = content.find(platform.marker_start)
+    if start < 0:
+        return content
+
+    end_marker: int = content.find(platform.marker_end, start)
+    if end_marker < 0:
+        # BUG-03 FIX: end marker missing — drop only the start marker line
+        # and keep the orphaned entries rather than eating the rest of
+        # the file.
         logger.warning(
             f"⚠️ Corrupted hosts file: marker_end missing for {platform.display_name}. "
-            f"Restoring {len(skipped_lines)} orphaned lines."
+            f"Keeping orphaned lines."
         )
-        result.extend(skipped_lines)
-
-    return "\n".join(result)
+        line_end: int = content.find("\n", start)
+        if line_end < 0:
+            return content[:start].rstrip("\n")
+        return content[:start] + content[line_end + 1:]
+
+    end: int = content.find("\n", end_marker)
+    end = end + 1 if end >= 0 else len(content)
+    # Collapse the separator newlines the removed section leaves behind,
+    # otherwise every block/unblock cycle accumulates blank lines and
+    # the callers' "content unchanged, skip rewrite" checks never hit.
+    head: str = content[:start].rstrip("\n")
+    tail: str = content[end:].lstrip("\n")
+    if not head:
+        return tail
+    if not tail:
+        return head + "\n"
+    return head + "\n\n" + tail
 
 
 def block_platform(platform: Platform) -> bool:
@@ -161,8 +238,14 @@ def block_platform(platform: Platform) -> bool:
             clean_content: str = _remove_existing_block(content, platform)
             block_section: str = _build_block_section(platform)
             new_content: str = clean_content.rstrip("\n") + "\n\n" + block_section + "\n"
+            if new_content == content:
+                logger.debug(f"{platform.display_name} already blocked; no rewrite needed.")
+                return True
             _write_hosts_file(new_content)
-            _flush_dns()
+            # Flushing costs hundreds of ms; skip it when the redirected
+            # domain set is unchanged (e.g. re-blocking moved the section).
+            if _domain_fingerprint(new_content) != _domain_fingerprint(content):
+                _flush_dns()
             logger.info(f"✅ {platform.display_name} BLOCKED in hosts file.")
             return True
         except PermissionError:
@@ -175,6 +258,48 @@ def block_platform(platform: Platform) -> bool:
             return False
 
 
+def block_platforms_bulk(platforms: list[Platform]) -> bool:
+    """
+    Block several platforms with a single hosts-file rewrite.
+
+    Startup and the shutdown fail-safe block every platform at once;
+    looping block_platform would read, rewrite, and replace the hosts
+    file once per platform. This splices all sections into one buffer
+    and pays for one write and at most one DNS flush for the batch.
+
+    Args:
+        platforms: The Platforms to block.
+
+    Returns:
+        bool: True if all platforms were blocked successfully.
+    """
+    with _hosts_lock:
+        try:
+            content: str = _read_hosts_file()
+            new_content: str = content
+            for platform in platforms:
+                clean: str = _remove_existing_block(new_content, platform)
+                section: str = _build_block_section(platform)
+                new_content = clean.rstrip("\n") + "\n\n" + section + "\n"
+            if new_content == content:
+                logger.debug("All platforms already blocked; no rewrite needed.")
+                return True
+            _write_hosts_file(new_content)
+            if _domain_fingerprint(new_content) != _domain_fingerprint(content):
+                _flush_dns()
+            names: str = ", ".join(p.display_name for p in platforms)
+            logger.info(f"✅ BLOCKED in hosts file (bulk): {names}.")
+            return True
+        except PermissionError:
+            logger.error(
+                "❌ Permission denied. Run DarkPause as Administrator."
+            )
+            return False
+        except Exception as e:
+            logger.error(f"❌ Failed to block platforms in bulk: {e}")
+            return False
+
+
 def unblock_platform(platform: Platform) -> bool:
     """
     Unblock a platform by removing redirect entries from the hosts file.
@@ -191,8 +316,12 @@ def unblock_platform(platform: Platform) -> bool:
         try:
             content: str = _read_hosts_file()
             clean_content: str = _remove_existing_block(content, platform)
+            if clean_content == content:
+                logger.debug(f"{platform.display_name} not blocked; no rewrite needed.")
+                return True
             _write_hosts_file(clean_content)
-            _flush_dns()
+            if _domain_fingerprint(clean_content) != _domain_fingerprint(content):
+                _flush_dns()
             logger.info(f"✅ {platform.display_name} UNBLOCKED from hosts file.")
             return True
         except PermissionError:
@@ -206,15 +335,27 @@ def unblock_platform(platform: Platform) -> bool:
 
 
 def is_blocked(platform: Platform) -> bool:
-    """Check if a platform is currently blocked in the hosts file."""
+    """
+    Check if a platform is currently blocked in the hosts file.
+
+    Memory-maps the file and runs the platform's precompiled marker
+    regex over the raw bytes — one C-level traversal covering both
+    markers, no decode. Falls back to the cached text read if mmap
+    fails (e.g. empty file).
+    """
     try:
-        content: str = _read_hosts_file()
-        return (
-            platform.marker_start in content
-            and platform.marker_end in content
-        )
+        with open(HOSTS_FILE_PATH, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return platform.marker_re.search(mm) is not None
     except Exception:
-        return False
+        try:
+            content: str = _read_hosts_file()
+            return (
+                platform.marker_start in content
+                and platform.marker_end in content
+            )
+        except Exception:
+            return False
 
 
 def _flush_dns() -> None:
@@ -222,7 +363,8 @@ def _flush_dns() -> None:
     try:
         subprocess.run(
             ["ipconfig", "/flushdns"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
             creationflags=subprocess.CREATE_NO_WINDOW,
             timeout=10,
@@ -246,8 +388,7 @@ def block_permanent_domains() -> bool:
     Returns:
         bool: True if blocking was successful, False otherwise.
     """
-    from .config import PERMANENT_BLOCK_TAG
-    from .permanent_blocks import get_all_permanent_domains
+    global _perm_section_cache
 
     all_domains: list[str] = get_all_permanent_domains()
 
@@ -255,16 +396,19 @@ def block_permanent_domains() -> bool:
         logger.debug("No permanent block domains configured.")
         return True
 
-    marker_start: str = f"# >>> DARKPAUSE-{PERMANENT_BLOCK_TAG}-START <<<"
-    marker_end: str = f"# >>> DARKPAUSE-{PERMANENT_BLOCK_TAG}-END <<<"
-
-    lines: list[str] = [marker_start]
-    lines.append("# DarkPause - Permanent Blocks (DO NOT EDIT)")
-    lines.append(f"# {len(all_domains)} domains blocked")
-    for domain in all_domains:
-        lines.append(f"{REDIRECT_IP} {domain}")
-    lines.append(marker_end)
-    block_section: str = "\n".join(lines)
+    domains_key: int = hash(tuple(all_domains))
+    if _perm_section_cache is not None and _perm_section_cache[0] == domains_key:
+        block_section: str = _perm_section_cache[1]
+    else:
+        prefix: str = REDIRECT_IP + " "
+        block_section = "\n".join([
+            _PERM_MARKER_START,
+            "# DarkPause - Permanent Blocks (DO NOT EDIT)",
+            f"# {len(all_domains)} domains blocked",
+            *[prefix + domain for domain in all_domains],
+            _PERM_MARKER_END,
+        ])
+        _perm_section_cache = (domains_key, block_section)
 
     with _hosts_lock:
         try:
@@ -273,10 +417,10 @@ def block_permanent_domains() -> bool:
             result_lines: list[str] = []
             inside_block: bool = False
             for line in content.splitlines():
-                if marker_start in line:
+                if _PERM_MARKER_START in line:
                     inside_block = True
                     continue
-                if marker_end in line:
+                if _PERM_MARKER_END in line:
                     inside_block = False
                     continue
                 if not inside_block:
@@ -284,8 +428,12 @@ def block_permanent_domains() -> bool:
 
             clean_content: str = "\n".join(result_lines)
             new_content: str = clean_content.rstrip("\n") + "\n\n" + block_section + "\n"
+            if new_content == content:
+                logger.debug("Permanent blocks already in place; no rewrite needed.")
+                return True
             _write_hosts_file(new_content)
-            _flush_dns()
+            if _domain_fingerprint(new_content) != _domain_fingerprint(content):
+                _flush_dns()
             logger.info(
                 f"🔒 Permanent blocks applied: {len(all_domains)} domains."
             )
@@ -298,6 +446,15 @@ def block_permanent_domains() -> bool:
             return False
 
 
+# Stat signature of the hosts file the last time verification passed.
+# The 30s integrity loop then costs one os.stat in the common
+# (untampered) case instead of a substring scan of the whole file.
+# The stat check alone is sufficient — hashing the bytes behind it
+# would re-read the file only to confirm what the signature already
+# proves, so no content hash is kept.
+_verified_sig: tuple[int, int] | None = None
+
+
 def verify_permanent_blocks() -> bool:
     """
     Verify that permanent blocks are still present in the hosts file.
@@ -308,17 +465,24 @@ def verify_permanent_blocks() -> bool:
     Returns:
         bool: True if blocks are confirmed present (or re-applied).
     """
-    from .config import PERMANENT_BLOCK_TAG
-
-    marker_start: str = f"# >>> DARKPAUSE-{PERMANENT_BLOCK_TAG}-START <<<"
-
+    global _verified_sig
     try:
+        st = HOSTS_FILE_PATH.stat()
+        sig: tuple[int, int] = (st.st_mtime_ns, st.st_size)
+        if sig == _verified_sig:
+            return True
+
         content: str = _read_hosts_file()
-        if marker_start in content:
+        if _PERM_MARKER_START in content:
+            _verified_sig = sig
             return True
 
         logger.warning("⚠️ Permanent blocks were removed! Re-applying...")
-        return block_permanent_domains()
+        if not block_permanent_domains():
+            return False
+        st = HOSTS_FILE_PATH.stat()
+        _verified_sig = (st.st_mtime_ns, st.st_size)
+        return True
     except Exception as e:
         logger.error(f"Integrity check failed: {e}")
         return False
@@ -23,6 +23,63 @@ logger = logging.getLogger(__name__)
 ICON_SIZE: int = 64
 """Size of the generated icon in pixels."""
 
+_FONT_SIZE: int = 20
+"""Point size for the text overlay font."""
+
+_COLOR_MAP: dict[str, str] = {
+    "blocked": COLOR_BLOCKED,
+    "active": COLOR_ACTIVE,
+    "warning": COLOR_WARNING,
+    "paused": COLOR_PAUSED,
+    "focus": COLOR_FOCUS,
+}
+
+_template_cache: dict[str, Image.Image] = {}
+
+_font_cache: dict[int, ImageFont.ImageFont] = {}
+
+# Finished icons keyed by (state, text). The countdown text only takes
+# ~60 distinct values per state, so this fills once and then every
+# tray redraw is a dict hit — no glyph rendering on the tick path.
+_icon_cache: dict[tuple[str, Optional[str]], Image.Image] = {}
+
+
+def _get_template(state: str) -> Image.Image:
+    """
+    Get the blank circle image for a state, rasterized at most once.
+
+    Only the countdown text changes between timer ticks; the backing
+    circle is identical per state, so callers copy a cached template
+    instead of re-allocating and re-drawing the ellipse every call.
+    """
+    template = _template_cache.get(state)
+    if template is None:
+        template = Image.new("RGBA", (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+        margin: int = 4
+        ImageDraw.Draw(template).ellipse(
+            [margin, margin, ICON_SIZE - margin, ICON_SIZE - margin],
+            fill=_COLOR_MAP.get(state, COLOR_BLOCKED),
+        )
+        _template_cache[state] = template
+    return template
+
+
+def _get_font(size: int) -> ImageFont.ImageFont:
+    """
+    Get the overlay font at the given size, loading it at most once.
+
+    Parsing arial.ttf costs tens of ms; the tray icon regenerates every
+    timer tick, so repeated loads would dominate icon creation.
+    """
+    font = _font_cache.get(size)
+    if font is None:
+        try:
+            font = ImageFont.truetype("arial.ttf", size)
+        except OSError:
+            font = ImageFont.load_default()
+        _font_cache[size] = font
+    return font
+
 
 def create_icon(
     state: str = "blocked",
@@ -36,33 +93,19 @@ def create_icon(
         text: Optional short text to overlay (e.g., "25").
 
     Returns:
-        Image.Image: A PIL Image suitable for pystray.
+        Image.Image: A PIL Image suitable for pystray. Cached per
+        (state, text) — callers must treat it as read-only.
     """
-    color_map: dict[str, str] = {
-        "blocked": COLOR_BLOCKED,
-        "active": COLOR_ACTIVE,
-        "warning": COLOR_WARNING,
-        "paused": COLOR_PAUSED,
-        "focus": COLOR_FOCUS,
-    }
-    bg_color: str = color_map.get(state, COLOR_BLOCKED)
-
-    img: Image.Image = Image.new("RGBA", (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
-    draw: ImageDraw.ImageDraw = ImageDraw.Draw(img)
+    cached = _icon_cache.get((state, text))
+    if cached is not None:
+        return cached
 
-    # Draw filled circle
-    margin: int = 4
-    draw.ellipse(
-        [margin, margin, ICON_SIZE - margin, ICON_SIZE - margin],
-        fill=bg_color,
-    )
+    img: Image.Image = _get_template(state).copy()
+    draw: ImageDraw.ImageDraw = ImageDraw.Draw(img)
 
     # Draw optional text overlay
     if text:
-        try:
-            font: ImageFont.FreeTypeFont = ImageFont.truetype("arial.ttf", 20)
-        except OSError:
-            font = ImageFont.load_default()
+        font: ImageFont.ImageFont = _get_font(_FONT_SIZE)
 
         bbox = draw.textbbox((0, 0), text, font=font)
         text_width: int = bbox[2] - bbox[0]
@@ -77,4 +120,5 @@ def create_icon(
             font=font,
         )
 
+    _icon_cache[(state, text)] = img
     return img
@@ -8,9 +8,16 @@ These blocks merge with the hardcoded PERMANENT_BLOCK_DOMAINS in config.py.
 
 import json
 import logging
+import os
+import tempfile
 from pathlib import Path
 
-from core.config import APP_DATA_DIR, PERMANENT_BLOCK_DOMAINS
+try:
+    import orjson  # C JSON codec; optional, stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+from core.config import APP_DATA_DIR, PERMANENT_BLOCK_DOMAINS_SORTED
 
 logger = logging.getLogger(__name__)
 
@@ -49,22 +56,36 @@ PRESETS: list[dict[str, str | list[str]]] = [
 
 # ─── Load / Save ───
 
+# Parsed blocks keyed by the file's st_mtime_ns, so the integrity loop
+# pays an os.stat instead of a JSON re-parse when nothing changed.
+_blocks_cache: tuple[int, list[dict]] | None = None
+
 
 def load_user_blocks() -> list[dict]:
     """
     Load user-configured permanent blocks from disk.
 
+    Re-parses the JSON file only when its mtime changes; otherwise a
+    copy of the cached list is returned (a copy, so callers mutating
+    the result can't corrupt the cache).
+
     Returns:
         list[dict]: List of block entries, each with 'label' and 'domains'.
     """
+    global _blocks_cache
     try:
         if not _BLOCKS_FILE.exists():
             return []
-        raw: str = _BLOCKS_FILE.read_text(encoding="utf-8")
-        data = json.loads(raw)
+        mtime_ns: int = _BLOCKS_FILE.stat().st_mtime_ns
+        cached = _blocks_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+        raw: bytes = _BLOCKS_FILE.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         if not isinstance(data, list):
             return []
-        return data
+        _blocks_cache = (mtime_ns, data)
+        return list(data)
     except Exception as e:
         logger.warning(f"Failed to load user blocks: {e}")
         return []
@@ -77,14 +98,30 @@ def save_user_blocks(blocks: list[dict]) -> None:
     Args:
         blocks: List of block entries, each with 'label' and 'domains'.
     """
+    global _blocks_cache
     try:
         APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        _BLOCKS_FILE.write_text(
-            json.dumps(blocks, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+        if orjson is not None:
+            payload: bytes = orjson.dumps(blocks, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(blocks, indent=2, ensure_ascii=False).encode("utf-8")
+
+        # Atomic replace so a crash mid-save can't corrupt the file
+        # (same pattern as the hosts writer).
+        fd, tmp_path = tempfile.mkstemp(
+            dir=str(APP_DATA_DIR), prefix=".blocks_", suffix=".tmp",
         )
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, str(_BLOCKS_FILE))
+
+        _blocks_cache = (_BLOCKS_FILE.stat().st_mtime_ns, list(blocks))
     except Exception as e:
         logger.error(f"Failed to save user blocks: {e}")
+        _blocks_cache = None
 
 
 # ─── CRUD ───
@@ -127,19 +164,12 @@ def get_all_permanent_domains() -> list[str]:
     Returns:
         list[str]: All domains that should be permanently blocked.
     """
-    all_domains: list[str] = list(PERMANENT_BLOCK_DOMAINS)
+    all_domains: list[str] = list(PERMANENT_BLOCK_DOMAINS_SORTED)
 
     for block in load_user_blocks():
         domains = block.get("domains", [])
         if isinstance(domains, list):
             all_domains.extend(domains)
 
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    unique: list[str] = []
-    for d in all_domains:
-        if d not in seen:
-            seen.add(d)
-            unique.append(d)
-
-    return unique
+    # Deduplicate while preserving order (dict.fromkeys runs in C)
+    return list(dict.fromkeys(all_domains))
@@ -5,8 +5,11 @@ Handles detection and termination of platform desktop app processes.
 Uses taskkill with PowerShell fallback for UWP/Store apps.
 """
 
+import csv
+import io
 import logging
 import subprocess
+import time
 
 from .config import Platform
 
@@ -14,6 +17,12 @@ logger = logging.getLogger(__name__)
 
 _SUBPROCESS_TIMEOUT: int = 10
 
+_PROCESS_CACHE_TTL_SECONDS: float = 0.5
+
+# (monotonic timestamp, running process names) shared across platforms,
+# so a scheduler sweep over N platforms costs one enumeration.
+_process_cache: tuple[float, set[str]] | None = None
+
 
 def _run_tasklist() -> str:
     """Run Windows tasklist command and return its output."""
@@ -34,28 +43,135 @@ def _run_tasklist() -> str:
         return ""
 
 
+def _running_processes(tasklist_output: str) -> set[str]:
+    """Parse tasklist CSV output into a set of lowercased image names."""
+    return {
+        row[0].lower()
+        for row in csv.reader(io.StringIO(tasklist_output))
+        if row
+    }
+
+
+_TH32CS_SNAPPROCESS: int = 0x00000002
+_MAX_PATH: int = 260
+
+
+def _enumerate_processes_winapi() -> set[str]:
+    """
+    Enumerate running process names via a Toolhelp snapshot.
+
+    A direct kernel32 CreateToolhelp32Snapshot walk takes a few
+    milliseconds and returns wide-char image names, versus the
+    50-200ms of spawning tasklist.exe and decoding its CSV output.
+    Raises on any WinAPI failure so callers can fall back to tasklist.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", ctypes.c_wchar * _MAX_PATH),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    # Declared signatures matter here: without a HANDLE restype ctypes
+    # truncates the snapshot handle to c_int, and on 64-bit the
+    # INVALID_HANDLE_VALUE comparison below could never match.
+    entry_p = ctypes.POINTER(PROCESSENTRY32W)
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, entry_p]
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, entry_p]
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot == wintypes.HANDLE(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    names: set[str] = set()
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        if not kernel32.Process32FirstW(snapshot, ctypes.byref(entry)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        while True:
+            names.add(entry.szExeFile.lower())
+            if not kernel32.Process32NextW(snapshot, ctypes.byref(entry)):
+                break
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return names
+
+
+def _get_running_processes() -> set[str]:
+    """
+    Running process names, via WinAPI with a tasklist fallback.
+
+    Results are cached for a short TTL so back-to-back calls (the
+    scheduler checks every platform in one sweep) share a single
+    enumeration.
+    """
+    global _process_cache
+    now: float = time.monotonic()
+    cached = _process_cache
+    if cached is not None and now - cached[0] < _PROCESS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    try:
+        running: set[str] = _enumerate_processes_winapi()
+    except Exception as e:
+        logger.debug(f"WinAPI process enumeration failed ({e}), using tasklist.")
+        running = _running_processes(_run_tasklist())
+
+    _process_cache = (now, running)
+    return running
+
+
 def is_app_running(platform: Platform) -> bool:
-    """Check if a platform's desktop app is currently running."""
+    """
+    Check if a platform's desktop app is currently running.
+
+    Enumerates running processes into a set once, then checks each
+    configured name with an O(1) lookup instead of scanning the whole
+    output per process name.
+    """
     if not platform.process_names:
         return False
 
-    tasklist_output: str = _run_tasklist()
-    lower_output: str = tasklist_output.lower()
+    running: set[str] = _get_running_processes()
 
     for process_name in platform.process_names:
-        if process_name.lower() in lower_output:
+        if process_name.lower() in running:
             logger.debug(f"{platform.display_name} process detected: {process_name}")
             return True
 
     return False
 
 
-def _kill_with_taskkill(process_name: str) -> bool:
-    """Attempt to kill a process using taskkill (Win32 apps)."""
+def _kill_with_taskkill(process_names: list[str]) -> bool:
+    """Attempt to kill processes using one taskkill call (Win32 apps)."""
+    args: list[str] = ["taskkill", "/F"]
+    for process_name in process_names:
+        args += ["/IM", process_name]
+
     try:
+        # stdout is never inspected; only stderr feeds the access-denied check.
         result = subprocess.run(
-            ["taskkill", "/F", "/IM", process_name],
-            capture_output=True,
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             creationflags=subprocess.CREATE_NO_WINDOW,
             timeout=_SUBPROCESS_TIMEOUT,
@@ -64,66 +180,77 @@ def _kill_with_taskkill(process_name: str) -> bool:
             return True
         stderr_lower: str = result.stderr.lower()
         if "access" in stderr_lower and "denied" in stderr_lower:
-            logger.debug(f"taskkill Access denied for {process_name}. Trying PowerShell...")
+            logger.debug("taskkill Access denied. Trying PowerShell...")
             return False
         return False
     except subprocess.TimeoutExpired:
-        logger.warning(f"taskkill timed out for {process_name}.")
+        logger.warning("taskkill timed out.")
         return False
     except Exception as e:
-        logger.error(f"taskkill failed for {process_name}: {e}")
+        logger.error(f"taskkill failed: {e}")
         return False
 
 
-def _kill_with_powershell(process_name: str) -> bool:
-    """Fallback: kill UWP/Store apps via PowerShell Stop-Process."""
-    name_without_ext: str = process_name
-    if name_without_ext.lower().endswith(".exe"):
-        name_without_ext = name_without_ext[:-4]
+def _kill_with_powershell(process_names: list[str]) -> bool:
+    """Fallback: kill UWP/Store apps via one PowerShell Stop-Process."""
+    names_without_ext: list[str] = [
+        name[:-4] if name.lower().endswith(".exe") else name
+        for name in process_names
+    ]
+    ps_array: str = "@(" + ",".join(f"'{n}'" for n in names_without_ext) + ")"
 
     try:
         result = subprocess.run(
             [
                 "powershell", "-NoProfile", "-NonInteractive", "-Command",
-                f"Get-Process -Name '{name_without_ext}' -ErrorAction SilentlyContinue | "
+                f"Get-Process -Name {ps_array} -ErrorAction SilentlyContinue | "
                 f"Stop-Process -Force -ErrorAction SilentlyContinue",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             creationflags=subprocess.CREATE_NO_WINDOW,
             timeout=_SUBPROCESS_TIMEOUT,
         )
         if result.returncode == 0:
-            logger.debug(f"PowerShell Stop-Process executed for {process_name}.")
+            logger.debug(f"PowerShell Stop-Process executed for {ps_array}.")
             return True
         return False
     except subprocess.TimeoutExpired:
-        logger.warning(f"PowerShell Stop-Process timed out for {process_name}.")
+        logger.warning("PowerShell Stop-Process timed out.")
         return False
     except Exception as e:
-        logger.error(f"PowerShell Stop-Process failed for {process_name}: {e}")
+        logger.error(f"PowerShell Stop-Process failed: {e}")
         return False
 
 
 def kill_app(platform: Platform) -> bool:
     """
     Terminate all desktop app processes for a platform.
-    Two-stage: taskkill first, PowerShell fallback for UWP.
+
+    Two-stage: one batched taskkill (all names via /IM), then one
+    PowerShell Stop-Process fallback for UWP. Process creation dominates
+    the cost on Windows, so this is 2 spawns instead of 2 per name.
+    Batching also supersedes running per-name kills on a thread pool:
+    there is no per-name subprocess left to parallelize, and two
+    sequential spawns are cheaper than a pool plus N concurrent ones.
     """
+    global _process_cache
+
     if not platform.process_names:
         logger.debug(f"No processes configured for {platform.display_name}.")
         return True
 
+    # The process table is about to change — drop the shared cache.
+    _process_cache = None
+
     killed_any: bool = False
 
-    for process_name in platform.process_names:
-        if _kill_with_taskkill(process_name):
-            logger.info(f"🔨 Killed process (taskkill): {process_name}")
-            killed_any = True
-            continue
-        if _kill_with_powershell(process_name):
-            logger.info(f"🔨 Killed process (PowerShell): {process_name}")
-            killed_any = True
+    if _kill_with_taskkill(platform.process_names):
+        logger.info(f"🔨 Killed processes (taskkill): {', '.join(platform.process_names)}")
+        killed_any = True
+    elif _kill_with_powershell(platform.process_names):
+        logger.info(f"🔨 Killed processes (PowerShell): {', '.join(platform.process_names)}")
+        killed_any = True
 
     if killed_any:
         logger.info(f"✅ {platform.display_name} app processes terminated.")
@@ -3,7 +3,8 @@ DarkPause - Recurring Schedule Manager.
 
 Allows users to create recurring weekly schedules that automatically
 trigger blackout sessions. Schedules persist in a JSON file and are
-checked every 60 seconds by a background thread.
+checked by a background thread that sleeps until the next schedule
+boundary (start or end time).
 
 Example schedule config:
 {
@@ -22,8 +23,8 @@ Example schedule config:
 
 import json
 import logging
+import secrets
 import threading
-import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
@@ -60,13 +61,28 @@ class Schedule:
         enabled: bool = True,
         schedule_id: str | None = None,
     ) -> None:
-        self.id: str = schedule_id or str(uuid.uuid4())[:8]
+        self.id: str = schedule_id or secrets.token_hex(4)
         self.name: str = name
         self.days: list[int] = days
         self.start: str = start
         self.end: str = end
         self.enabled: bool = enabled
 
+        # Parse the HH:MM strings and days once here so the checks that
+        # run on every tick are two integer compares and a set lookup.
+        self._days_set: frozenset[int] = frozenset(days)
+        try:
+            start_h, start_m = map(int, start.split(":"))
+            end_h, end_m = map(int, end.split(":"))
+            self._start_minutes: int = start_h * 60 + start_m
+            self._end_minutes: int = end_h * 60 + end_m
+            self._valid: bool = True
+        except (ValueError, AttributeError):
+            logger.warning(f"Invalid time format in schedule '{name}'.")
+            self._start_minutes = 0
+            self._end_minutes = 0
+            self._valid = False
+
     def to_dict(self) -> dict:
         """Serialize schedule to a dictionary for JSON persistence."""
         return {
@@ -98,6 +114,24 @@ class Schedule:
             schedule_id=data.get("id"),
         )
 
+    def is_active_at(self, weekday: int, current_minutes: int) -> bool:
+        """
+        Check if this schedule is active at the given time.
+
+        Args:
+            weekday: Weekday number (0=Monday).
+            current_minutes: Minutes since midnight.
+
+        Returns:
+            bool: True if the weekday and time fall within this schedule.
+        """
+        return (
+            self._valid
+            and self.enabled
+            and weekday in self._days_set
+            and self._start_minutes <= current_minutes < self._end_minutes
+        )
+
     def is_active_now(self) -> bool:
         """
         Check if this schedule should be active at the current time.
@@ -105,45 +139,30 @@ class Schedule:
         Returns:
             bool: True if today's weekday and current time fall within this schedule.
         """
-        if not self.enabled:
-            return False
-
         now: datetime = datetime.now()
-        current_weekday: int = now.weekday()  # 0=Monday
-
-        if current_weekday not in self.days:
-            return False
+        return self.is_active_at(now.weekday(), now.hour * 60 + now.minute)
 
-        try:
-            start_parts: list[str] = self.start.split(":")
-            end_parts: list[str] = self.end.split(":")
-            start_minutes: int = int(start_parts[0]) * 60 + int(start_parts[1])
-            end_minutes: int = int(end_parts[0]) * 60 + int(end_parts[1])
-            current_minutes: int = now.hour * 60 + now.minute
-
-            return start_minutes <= current_minutes < end_minutes
-        except (ValueError, IndexError):
-            logger.warning(f"Invalid time format in schedule '{self.name}'.")
-            return False
-
-    def remaining_minutes(self) -> int:
+    def remaining_at(self, current_minutes: int) -> int:
         """
-        Calculate remaining minutes until this schedule's end time.
+        Minutes from the given time until this schedule's end time.
+
+        Note: Does NOT re-check activity — the caller should verify
+        before calling this to avoid redundant checks.
 
-        Note: Does NOT re-check is_active_now() — the caller should
-        verify activity before calling this to avoid redundant checks.
+        Args:
+            current_minutes: Minutes since midnight.
 
         Returns:
             int: Minutes remaining, or 0 if not calculable.
         """
-        now: datetime = datetime.now()
-        try:
-            end_parts: list[str] = self.end.split(":")
-            end_minutes: int = int(end_parts[0]) * 60 + int(end_parts[1])
-            current_minutes: int = now.hour * 60 + now.minute
-            return max(0, end_minutes - current_minutes)
-        except (ValueError, IndexError):
+        if not self._valid:
             return 0
+        return max(0, self._end_minutes - current_minutes)
+
+    def remaining_minutes(self) -> int:
+        """Minutes remaining until the end time, from the current clock."""
+        now: datetime = datetime.now()
+        return self.remaining_at(now.hour * 60 + now.minute)
 
     def __repr__(self) -> str:
         days_str: str = ",".join(str(d) for d in self.days)
@@ -171,18 +190,19 @@ def _load_schedules() -> list[Schedule]:
         return []
 
 
-def _save_schedules(schedules: list[Schedule]) -> None:
+def _save_schedules(schedule_dicts: list[dict]) -> None:
     """
-    Save schedules to the JSON file.
+    Save already-serialized schedules to the JSON file.
+
+    Takes plain dicts so callers can snapshot under their lock and run
+    the JSON encode + disk write outside it.
 
     Args:
-        schedules: List of Schedule instances to persist.
+        schedule_dicts: Schedule dicts (from Schedule.to_dict) to persist.
     """
     try:
         APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        data: dict = {
-            "schedules": [s.to_dict() for s in schedules],
-        }
+        data: dict = {"schedules": schedule_dicts}
         _SCHEDULE_FILE.write_text(
             json.dumps(data, indent=2),
             encoding="utf-8",
@@ -198,9 +218,9 @@ class ScheduleManager:
     """
     Manages recurring weekly schedules with a background check thread.
 
-    The manager loads schedules from disk, checks every 60 seconds
-    if any schedule should be active, and triggers a blackout callback
-    if one is active and no blackout is currently running.
+    The manager loads schedules from disk, wakes at each schedule
+    boundary to check if any schedule should be active, and triggers a
+    blackout callback if one is active and no blackout is running.
 
     Args:
         on_start_blackout: Callback to start a blackout (receives minutes, locked).
@@ -215,8 +235,16 @@ class ScheduleManager:
         self._on_start_blackout: Callable[[int, bool], None] = on_start_blackout
         self._is_blackout_active: Callable[[], bool] = is_blackout_active
         self._schedules: list[Schedule] = _load_schedules()
+        # ID index kept in lockstep with the list: mutations from the UI
+        # resolve their target in O(1) instead of scanning under _lock.
+        self._schedules_by_id: dict[str, Schedule] = {
+            s.id: s for s in self._schedules
+        }
         self._thread: Optional[threading.Thread] = None
         self._stop_event: threading.Event = threading.Event()
+        # Separate from _stop_event: pulsing the stop event for wakeups
+        # could clear a concurrent stop() signal before the checker saw it.
+        self._wake_event: threading.Event = threading.Event()
         self._lock: threading.Lock = threading.Lock()
         self._triggered_today: set[str] = set()  # Track which schedules triggered today
         self._last_check_date: str = ""
@@ -227,6 +255,17 @@ class ScheduleManager:
         with self._lock:
             return list(self._schedules)
 
+    def _wake_checker(self) -> None:
+        """
+        Re-arm the check thread after a schedule mutation.
+
+        Sets the wake event so a checker sleeping until the (now stale)
+        next boundary wakes up and recomputes its wait; the loop clears
+        it after each wakeup.
+        """
+        if self._thread and self._thread.is_alive():
+            self._wake_event.set()
+
     def add_schedule(self, schedule: Schedule) -> None:
         """
         Add a new schedule and persist to disk.
@@ -236,7 +275,10 @@ class ScheduleManager:
         """
         with self._lock:
             self._schedules.append(schedule)
-            _save_schedules(self._schedules)
+            self._schedules_by_id[schedule.id] = schedule
+            snapshot: list[dict] = [s.to_dict() for s in self._schedules]
+        _save_schedules(snapshot)
+        self._wake_checker()
         logger.info(f"📅 Schedule added: {schedule}")
 
     def remove_schedule(self, schedule_id: str) -> bool:
@@ -250,13 +292,15 @@ class ScheduleManager:
             bool: True if a schedule was found and removed.
         """
         with self._lock:
-            before_count: int = len(self._schedules)
-            self._schedules = [s for s in self._schedules if s.id != schedule_id]
-            if len(self._schedules) < before_count:
-                _save_schedules(self._schedules)
-                logger.info(f"🗑 Schedule removed: {schedule_id}")
-                return True
-            return False
+            removed: Schedule | None = self._schedules_by_id.pop(schedule_id, None)
+            if removed is None:
+                return False
+            self._schedules.remove(removed)
+            snapshot: list[dict] = [s.to_dict() for s in self._schedules]
+        _save_schedules(snapshot)
+        logger.info(f"🗑 Schedule removed: {schedule_id}")
+        self._wake_checker()
+        return True
 
     def toggle_schedule(self, schedule_id: str) -> bool:
         """
@@ -269,14 +313,16 @@ class ScheduleManager:
             bool: True if the schedule was found and toggled.
         """
         with self._lock:
-            for schedule in self._schedules:
-                if schedule.id == schedule_id:
-                    schedule.enabled = not schedule.enabled
-                    _save_schedules(self._schedules)
-                    state: str = "enabled" if schedule.enabled else "disabled"
-                    logger.info(f"📅 Schedule '{schedule.name}' {state}.")
-                    return True
-            return False
+            toggled: Schedule | None = self._schedules_by_id.get(schedule_id)
+            if toggled is None:
+                return False
+            toggled.enabled = not toggled.enabled
+            snapshot: list[dict] = [s.to_dict() for s in self._schedules]
+        _save_schedules(snapshot)
+        state: str = "enabled" if toggled.enabled else "disabled"
+        logger.info(f"📅 Schedule '{toggled.name}' {state}.")
+        self._wake_checker()
+        return True
 
     def start(self) -> None:
         """Start the background schedule checking thread."""
@@ -284,6 +330,7 @@ class ScheduleManager:
             return
 
         self._stop_event.clear()
+        self._wake_event.clear()
         self._thread = threading.Thread(
             target=self._check_loop,
             daemon=True,
@@ -295,20 +342,73 @@ class ScheduleManager:
     def stop(self) -> None:
         """Stop the background schedule checking thread."""
         self._stop_event.set()
+        self._wake_event.set()  # Rouse a checker parked on the wake event
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
         self._thread = None
         logger.info("📅 Scheduler stopped.")
 
+    def _seconds_until_next_boundary(self) -> float | None:
+        """
+        Seconds until the next enabled schedule start/end boundary.
+
+        Returns None when no enabled schedule exists, so the check loop
+        can sleep indefinitely instead of polling — mutations re-arm it
+        via _wake_checker. The wait is capped at _CHECK_INTERVAL_SECONDS
+        as a safety net against clock changes.
+        """
+        now: datetime = datetime.now()
+        week_seconds: int = 7 * 24 * 3600
+        now_seconds: int = (
+            (now.weekday() * 1440 + now.hour * 60 + now.minute) * 60 + now.second
+        )
+
+        best: int | None = None
+        with self._lock:
+            schedules: list[Schedule] = list(self._schedules)
+        for schedule in schedules:
+            if not schedule.enabled or not schedule._valid:
+                continue
+            for day in schedule._days_set:
+                for minutes in (schedule._start_minutes, schedule._end_minutes):
+                    boundary: int = (day * 1440 + minutes) * 60
+                    # +1s slack so we wake just past the boundary
+                    delta: int = (boundary - now_seconds) % week_seconds + 1
+                    if best is None or delta < best:
+                        best = delta
+
+        if best is None:
+            return None
+        return min(best, _CHECK_INTERVAL_SECONDS)
+
     def _check_loop(self) -> None:
-        """Background loop checking schedules every 60 seconds."""
+        """
+        Background loop that sleeps until the next schedule boundary.
+
+        Instead of a fixed 60s poll, each iteration waits exactly until
+        the next start/end time (sub-second trigger accuracy) and blocks
+        forever when nothing is enabled (zero idle wakeups).
+        """
         while not self._stop_event.is_set():
             self._check_schedules()
-            self._stop_event.wait(timeout=_CHECK_INTERVAL_SECONDS)
+            self._wake_event.wait(timeout=self._seconds_until_next_boundary())
+            self._wake_event.clear()
 
     def _check_schedules(self) -> None:
         """Check if any schedule should trigger a blackout right now."""
-        today: str = datetime.now().strftime("%Y-%m-%d")
+        # Nothing to poll when nothing is configured (common first-run
+        # case) — skip the clock read and blackout-state callback
+        # entirely. len() is GIL-atomic, no lock needed for the check.
+        if not self._schedules:
+            return
+
+        # One clock read shared by every schedule in this sweep
+        now: datetime = datetime.now()
+        weekday: int = now.weekday()
+        current_minutes: int = now.hour * 60 + now.minute
+        # isoformat is the same YYYY-MM-DD without the strftime
+        # format-string parse; this runs on every wakeup.
+        today: str = now.date().isoformat()
 
         # Reset triggered set on new day
         if today != self._last_check_date:
@@ -319,18 +419,24 @@ class ScheduleManager:
         if self._is_blackout_active():
             return
 
+        # Snapshot under the lock, then check and fire the callback
+        # without holding it — add/remove/toggle from the UI never block
+        # behind the checker. _triggered_today stays lock-free: the check
+        # thread is its only writer.
         with self._lock:
-            for schedule in self._schedules:
-                if schedule.id in self._triggered_today:
-                    continue
-
-                if schedule.is_active_now():
-                    remaining: int = schedule.remaining_minutes()
-                    if remaining > 0:
-                        logger.info(
-                            f"⏰ Schedule '{schedule.name}' triggered! "
-                            f"Blackout for {remaining} min."
-                        )
-                        self._triggered_today.add(schedule.id)
-                        self._on_start_blackout(remaining, False)
-                        return  # Only one blackout at a time
+            snapshot: list[Schedule] = list(self._schedules)
+
+        for schedule in snapshot:
+            if schedule.id in self._triggered_today:
+                continue
+
+            if schedule.is_active_at(weekday, current_minutes):
+                remaining: int = schedule.remaining_at(current_minutes)
+                if remaining > 0:
+                    logger.info(
+                        f"⏰ Schedule '{schedule.name}' triggered! "
+                        f"Blackout for {remaining} min."
+                    )
+                    self._triggered_today.add(schedule.id)
+                    self._on_start_blackout(remaining, False)
+                    return  # Only one blackout at a time
@@ -1,35 +1,58 @@
 """
 DarkPause - Daily Usage Tracker.
 
-Tracks cumulative usage per platform per day using individual JSON files.
-Persists data across app restarts and handles daily resets at RESET_HOUR.
-Uses atomic writes and per-platform locks for thread safety.
+Tracks cumulative usage per platform per day using individual
+fixed-layout binary record files. Persists data across app restarts and
+handles daily resets at RESET_HOUR. Uses atomic writes and per-platform
+locks for thread safety.
 """
 
+import atexit
 import json
 import logging
 import os
+import struct
 import tempfile
 import threading
+import time
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import TypedDict
 
-from .config import APP_DATA_DIR, RESET_HOUR, Platform
+from .config import APP_DATA_DIR, RESET_HOUR, Platform, get_platform_by_id
 
 logger = logging.getLogger(__name__)
 
+_FLUSH_INTERVAL_SECONDS: int = 15
+"""How often the background flusher persists dirty usage counters."""
+
+_USAGE_RECORD: struct.Struct = struct.Struct("<10sdI")
+"""Fixed on-disk layout: 10-byte ISO date, f64 seconds, u32 sessions.
+
+22 bytes total — well under a sector, so the os.replace rename is the
+only atomicity the write needs. Decoding is one struct.unpack with no
+parser or intermediate allocations.
+"""
+
+_DEBUG_JSON_EXPORT: bool = False
+"""When True, also mirror each save to the legacy JSON file for inspection."""
+
 _platform_locks: dict[str, threading.Lock] = {}
-_locks_lock: threading.Lock = threading.Lock()
+
+# Last payload written per platform, to skip no-op tempfile write cycles
+_last_written: dict[str, bytes] = {}
 
 
 def _get_platform_lock(platform: Platform) -> threading.Lock:
-    """Get or create a thread lock for a specific platform."""
-    if platform.id not in _platform_locks:
-        with _locks_lock:
-            if platform.id not in _platform_locks:
-                _platform_locks[platform.id] = threading.Lock()
-    return _platform_locks[platform.id]
+    """
+    Get or create a thread lock for a specific platform.
+
+    dict.setdefault is a single atomic operation under the GIL, so no
+    outer lock or double-checked init is needed. If two threads race on
+    first touch, one Lock is created and thrown away unused — harmless,
+    since it was never bound to any state.
+    """
+    return _platform_locks.setdefault(platform.id, threading.Lock())
 
 
 class UsageData(TypedDict):
@@ -39,9 +62,21 @@ class UsageData(TypedDict):
     sessions: int
 
 
+_data_dir_ready: bool = False
+
+
 def _ensure_data_dir() -> None:
-    """Create the application data directory if it doesn't exist."""
+    """
+    Create the application data directory if it doesn't exist.
+
+    Remembers success so repeat callers skip the mkdir stat syscalls —
+    this sits on every load/save path.
+    """
+    global _data_dir_ready
+    if _data_dir_ready:
+        return
     APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _data_dir_ready = True
 
 
 def _get_logical_day_str() -> str:
@@ -55,37 +90,148 @@ def _get_logical_day_str() -> str:
 
 
 def _get_usage_file(platform: Platform) -> Path:
-    """Get the path to a platform's usage JSON file."""
+    """Get the path to a platform's legacy usage JSON file."""
     return APP_DATA_DIR / platform.usage_file_name
 
 
+def _get_record_file(platform: Platform) -> Path:
+    """Get the path to a platform's binary usage record file."""
+    return (APP_DATA_DIR / platform.usage_file_name).with_suffix(".bin")
+
+
+def _pack(data: UsageData) -> bytes:
+    """Encode a UsageData dict into the fixed binary record layout."""
+    return _USAGE_RECORD.pack(
+        data["date"].encode("ascii"),
+        data["used_seconds"],
+        data["sessions"],
+    )
+
+
+def _unpack(buf: bytes) -> UsageData:
+    """Decode a fixed binary record back into a UsageData dict."""
+    date_bytes, used_seconds, sessions = _USAGE_RECORD.unpack(buf)
+    return UsageData(
+        date=date_bytes.decode("ascii"),
+        used_seconds=used_seconds,
+        sessions=sessions,
+    )
+
+
+def _read_record(platform: Platform) -> UsageData | None:
+    """
+    Read a platform's binary usage record, if present and well-formed.
+
+    Falls back to the legacy JSON file (pre-binary installs) so existing
+    counters survive the format change; the next save writes the record.
+    Returns None when neither exists or either is malformed.
+    """
+    record_file: Path = _get_record_file(platform)
+    try:
+        buf: bytes = record_file.read_bytes()
+        return _unpack(buf)
+    except FileNotFoundError:
+        pass
+    except (struct.error, UnicodeDecodeError) as e:
+        logger.warning(f"Malformed usage record {record_file.name}, resetting: {e}")
+        return None
+
+    usage_file: Path = _get_usage_file(platform)
+    try:
+        raw: str = usage_file.read_text(encoding="utf-8")
+        return json.loads(raw)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, KeyError) as e:
+        logger.warning(f"Corrupted usage file for {platform.display_name}, resetting: {e}")
+        return None
+
+
+# In-memory copy of each platform's UsageData, loaded once and written
+# through on mutation. The 1Hz UI polling then never touches the disk;
+# the logical-day check below still forces a reset at RESET_HOUR.
+_cache: dict[str, UsageData] = {}
+
+# Platform IDs whose cached data has unpersisted mutations. add_usage
+# runs ~once per second during a session; fsyncing every call would
+# dominate disk IOPS, so writes are coalesced by a background flusher.
+_dirty: set[str] = set()
+_flusher_thread: threading.Thread | None = None
+
+
+def _mark_dirty(platform: Platform) -> None:
+    """Queue a platform's cached data for the next background flush."""
+    global _flusher_thread
+    _dirty.add(platform.id)
+    if _flusher_thread is None or not _flusher_thread.is_alive():
+        _flusher_thread = threading.Thread(
+            target=_flush_loop,
+            daemon=True,
+            name="usage-flusher",
+        )
+        _flusher_thread.start()
+
+
+def _flush_loop() -> None:
+    """Background loop persisting dirty counters every flush interval."""
+    while True:
+        time.sleep(_FLUSH_INTERVAL_SECONDS)
+        flush()
+
+
+def flush() -> None:
+    """
+    Persist all dirty usage counters to disk now.
+
+    Called periodically by the background flusher and explicitly on
+    shutdown so at most one flush interval of usage can be lost.
+    """
+    for platform_id in list(_dirty):
+        platform = get_platform_by_id(platform_id)
+        if platform is None:
+            _dirty.discard(platform_id)
+            continue
+        with _get_platform_lock(platform):
+            data = _cache.get(platform_id)
+            _dirty.discard(platform_id)
+            if data is not None:
+                _save_data(platform, data)
+
+
+atexit.register(flush)
+
+
 def _load_data(platform: Platform) -> UsageData:
     """Load usage data for a platform. Caller MUST hold the platform lock."""
-    _ensure_data_dir()
     today: str = _get_logical_day_str()
-    usage_file: Path = _get_usage_file(platform)
 
-    if usage_file.exists():
-        try:
-            raw: str = usage_file.read_text(encoding="utf-8")
-            data: UsageData = json.loads(raw)
-            if data.get("date") == today:
-                return data
-            logger.info(
-                f"🔄 New day detected for {platform.display_name}. "
-                f"Resetting usage counter for {today}."
-            )
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Corrupted usage file for {platform.display_name}, resetting: {e}")
+    cached: UsageData | None = _cache.get(platform.id)
+    if cached is not None and cached["date"] == today:
+        return cached
 
-    return UsageData(date=today, used_seconds=0.0, sessions=0)
+    _ensure_data_dir()
+
+    data: UsageData | None = _read_record(platform)
+    if data is not None and data.get("date") != today:
+        logger.info(
+            f"🔄 New day detected for {platform.display_name}. "
+            f"Resetting usage counter for {today}."
+        )
+        data = None
+
+    if data is None:
+        data = UsageData(date=today, used_seconds=0.0, sessions=0)
+    _cache[platform.id] = data
+    return data
 
 
 def _save_data(platform: Platform, data: UsageData) -> None:
     """Atomically save usage data. Caller MUST hold the platform lock."""
     _ensure_data_dir()
-    usage_file: Path = _get_usage_file(platform)
-    json_content: str = json.dumps(data, indent=2)
+    record_file: Path = _get_record_file(platform)
+    record: bytes = _pack(data)
+    if _last_written.get(platform.id) == record:
+        return
 
     fd: int = -1
     tmp_path: str = ""
@@ -95,17 +241,28 @@ def _save_data(platform: Platform, data: UsageData) -> None:
             prefix=f".{platform.id}_",
             suffix=".tmp",
         )
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            fd = -1
-            f.write(json_content)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp_path, str(usage_file))
+        os.write(fd, record)
+        os.close(fd)
+        fd = -1
+        # No fsync: usage counters are soft-durable. os.replace still
+        # gives atomic visibility (no torn file), and on a crash we lose
+        # at most a flush interval of easily-reconstructible seconds —
+        # the same tolerance the malformed-record reset path already has.
+        os.replace(tmp_path, str(record_file))
         tmp_path = ""
+        _last_written[platform.id] = record
+        if _DEBUG_JSON_EXPORT:
+            try:
+                _get_usage_file(platform).write_text(
+                    json.dumps(data, separators=(",", ":")),
+                    encoding="utf-8",
+                )
+            except Exception as export_err:
+                logger.debug(f"Debug JSON export failed: {export_err}")
     except Exception as e:
         logger.error(f"Failed to save usage data for {platform.display_name}: {e}")
         try:
-            usage_file.write_text(json_content, encoding="utf-8")
+            record_file.write_bytes(record)
         except Exception as fallback_err:
             logger.error(f"Fallback write also failed: {fallback_err}")
     finally:
@@ -137,13 +294,19 @@ def get_remaining_seconds(platform: Platform) -> float:
 
 
 def add_usage(platform: Platform, seconds: float) -> float:
-    """Add usage time to a platform's daily counter. Thread-safe."""
+    """
+    Add usage time to a platform's daily counter. Thread-safe.
+
+    Only mutates the in-memory counter and marks it dirty; the
+    background flusher persists it within _FLUSH_INTERVAL_SECONDS.
+    """
     lock = _get_platform_lock(platform)
     with lock:
         data: UsageData = _load_data(platform)
         data["used_seconds"] += seconds
-        _save_data(platform, data)
-        return data["used_seconds"]
+        used: float = data["used_seconds"]
+    _mark_dirty(platform)
+    return used
 
 
 def increment_session_count(platform: Platform) -> int:
@@ -152,8 +315,9 @@ def increment_session_count(platform: Platform) -> int:
     with lock:
         data: UsageData = _load_data(platform)
         data["sessions"] += 1
-        _save_data(platform, data)
-        return data["sessions"]
+        sessions: int = data["sessions"]
+    _mark_dirty(platform)
+    return sessions
 
 
 def is_limit_reached(platform: Platform) -> bool:
@@ -184,5 +348,6 @@ def reset_platform(platform: Platform) -> None:
     lock = _get_platform_lock(platform)
     with lock:
         data = UsageData(date=_get_logical_day_str(), used_seconds=0.0, sessions=0)
+        _cache[platform.id] = data
         _save_data(platform, data)
     logger.info(f"🔄 Usage data reset for {platform.display_name}.")
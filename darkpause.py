@@ -15,10 +15,7 @@ and starts the system tray + Tkinter event loop.
 import ctypes
 import logging
 import os
-import socket
 import sys
-import threading
-import tkinter as tk
 from pathlib import Path
 
 # ─── Ensure correct working directory ───
@@ -29,49 +26,112 @@ if _SCRIPT_DIR not in sys.path:
     sys.path.insert(0, _SCRIPT_DIR)
 os.chdir(_SCRIPT_DIR)
 
+# ─── shell32 bindings ───
+# Bound once at import with explicit signatures: skips the attribute
+# resolution ctypes.windll does per access, and the declared types stop
+# pointer-sized HINSTANCE results being truncated to int. None on
+# non-Windows (dev boxes) — callers degrade the same way the old
+# AttributeError handlers did.
+_shell32 = None
+_IsUserAnAdmin = None
+_ShellExecuteW = None
+try:
+    from ctypes import wintypes
+
+    _shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.restype = ctypes.c_int
+    _ShellExecuteW = _shell32.ShellExecuteW
+    _ShellExecuteW.argtypes = [
+        wintypes.HWND,
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        ctypes.c_int,
+    ]
+    _ShellExecuteW.restype = wintypes.HINSTANCE
+except (AttributeError, OSError):
+    _shell32 = None
+
+# kernel32 gets the same treatment: use_last_error=True is required for
+# a reliable ctypes.get_last_error() after CreateMutexW (GetLastError
+# via ctypes.windll can be clobbered by ctypes' own intervening Win32
+# calls), and the HANDLE restype stops pointer truncation.
+_kernel32 = None
+_CreateMutexW = None
+_CloseHandle = None
+try:
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CreateMutexW = _kernel32.CreateMutexW
+    _CreateMutexW.argtypes = [
+        wintypes.LPVOID,
+        wintypes.BOOL,
+        wintypes.LPCWSTR,
+    ]
+    _CreateMutexW.restype = wintypes.HANDLE
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+except (AttributeError, OSError):
+    _kernel32 = None
+    _CreateMutexW = None
+    _CloseHandle = None
+
 # ─── Windows AppUserModelID ───
 # Tell Windows this is a standalone app, not "pythonw.exe".
 # This gives DarkPause its own taskbar icon and identity.
 try:
-    ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("darkpause.app.2.1")
+    if _shell32 is not None:
+        _shell32.SetCurrentProcessExplicitAppUserModelID("darkpause.app.2.1")
 except (AttributeError, OSError):
     pass  # Non-critical — app still works, just shows Python icon
 
 logger = logging.getLogger("darkpause")
 
+_BANNER: str = "=" * 50
+
 # ─── Single Instance ───
-_instance_socket: socket.socket | None = None
+_MUTEX_NAME: str = "Global\\DarkPause_SingleInstance"
+_ERROR_ALREADY_EXISTS: int = 183  # winerror.h
+_instance_mutex: int | None = None
 
-# ─── Integrity Check Interval ───
-_INTEGRITY_CHECK_MS: int = 30_000  # 30 seconds
+# ─── Integrity Check Intervals ───
+_INTEGRITY_CHECK_MS: int = 30_000  # 30 seconds — hosts file (stat-cheap)
+_FIREWALL_CHECK_MS: int = 300_000  # 5 minutes — netsh rule poll (subprocess)
 
 
-def _check_single_instance(port: int) -> None:
+def _check_single_instance() -> None:
     """
     Ensure only one instance of DarkPause is running.
 
-    Args:
-        port: TCP port to bind for single-instance check.
+    Claims a Win32 named mutex — one syscall, no Winsock stack, and
+    nothing for netstat or the firewall to notice (the old TCP-port
+    probe briefly opened a visible listener). The handle is held for
+    the process lifetime and closed in main()'s finally block.
     """
-    global _instance_socket
-    _instance_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    try:
-        _instance_socket.bind(("127.0.0.1", port))
-    except socket.error:
+    global _instance_mutex
+    if _CreateMutexW is None:
+        return  # Non-Windows — no mutex namespace to claim
+
+    handle: int | None = _CreateMutexW(None, True, _MUTEX_NAME)
+    if not handle or ctypes.get_last_error() == _ERROR_ALREADY_EXISTS:
         logger.warning("DarkPause is already running. Exiting.")
         sys.exit(0)
+    _instance_mutex = handle
 
 
 # ─── Admin Privileges ───
 def _is_admin() -> bool:
     """Check if the current process has Administrator privileges."""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin() != 0
-    except AttributeError:
+    if _IsUserAnAdmin is None:
         return False
+    return _IsUserAnAdmin() != 0
 
 
-def _get_pythonw_path() -> str:
+def _resolve_pythonw_path() -> str:
     """
     Resolve the path to pythonw.exe robustly.
 
@@ -97,6 +157,11 @@ def _get_pythonw_path() -> str:
     return "pythonw.exe"
 
 
+# Pure function of sys.executable — resolve once at import so the
+# filesystem probe isn't repeated on the restart path.
+_PYTHONW_PATH: str = _resolve_pythonw_path()
+
+
 def _request_admin_restart() -> None:
     """
     Restart the script with Administrator privileges using UAC.
@@ -104,12 +169,11 @@ def _request_admin_restart() -> None:
     Uses pythonw.exe for windowless execution so no console appears.
     """
     try:
-        pythonw: str = _get_pythonw_path()
         quoted_args: str = " ".join(f'"{arg}"' for arg in sys.argv)
-        ctypes.windll.shell32.ShellExecuteW(
+        _ShellExecuteW(
             None,
             "runas",
-            pythonw,
+            _PYTHONW_PATH,
             quoted_args,
             None,
             0,  # SW_HIDE
@@ -123,34 +187,58 @@ def _setup_logging(log_file: Path) -> None:
     """
     Configure application-wide logging.
 
+    The file handler is wrapped in a MemoryHandler so records are
+    buffered and written in batches instead of hitting the disk per log
+    line. Errors flush immediately; _flush_log covers the checkpoints
+    where the file must be current (pythonw has no console to fall
+    back on).
+
     Args:
         log_file: Path to the log file.
     """
+    from logging.handlers import MemoryHandler
+
+    file_handler = logging.FileHandler(str(log_file), encoding="utf-8")
+    # basicConfig formats the handlers it is given; the wrapped target
+    # formats its own records on flush, so it needs the formatter too.
+    file_handler.setFormatter(logging.Formatter(
+        fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    ))
+    buffered_handler = MemoryHandler(
+        capacity=64,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
         handlers=[
-            logging.FileHandler(str(log_file), encoding="utf-8"),
+            buffered_handler,
             logging.StreamHandler(),
         ],
     )
 
 
+def _flush_log() -> None:
+    """Force flush all log handlers (critical for pythonw)."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
 # ─── Main ───
 def main() -> None:
     """Main entry point for DarkPause."""
-    from core.config import (
-        ALL_PLATFORMS, APP_DATA_DIR, APP_NAME, RESET_HOUR, SINGLE_INSTANCE_PORT,
-    )
+    from core.config import ALL_PLATFORMS, APP_DATA_DIR, APP_NAME, RESET_HOUR
 
     APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
     log_file: Path = APP_DATA_DIR / "darkpause.log"
     _setup_logging(log_file)
 
-    logger.info("=" * 50)
-    logger.info(f"  {APP_NAME} Starting...")
-    logger.info("=" * 50)
+    logger.info(_BANNER)
+    logger.info("  %s Starting...", APP_NAME)
+    logger.info(_BANNER)
 
     # Admin check
     if not _is_admin():
@@ -162,29 +250,38 @@ def main() -> None:
     logger.info("🔑 Running with Administrator privileges.")
 
     # Single instance
-    _check_single_instance(SINGLE_INSTANCE_PORT)
+    _check_single_instance()
 
-    logger.info(f"   📁 Data dir: {APP_DATA_DIR}")
-    logger.info(f"   📝 Log file: {log_file}")
-    logger.info(f"   🔄 Daily reset at: {RESET_HOUR:02d}:00")
+    # ─── Import prelude ───
+    # All remaining deferred imports in one pass, now that the UAC
+    # fast path (which must not pay for the GUI stack) is behind us.
+    # One block means one trip through the import machinery instead of
+    # import-lock acquisitions scattered between startup steps and
+    # racing the tray thread.
+    import tkinter as tk
 
-    # ─── Apply permanent blocks + DNS anti-bypass ───
     from core import hosts_manager, firewall_manager
+    from core.scheduler import ScheduleManager
+    from ui.blackout import ScreenBlackout, load_persisted_blackout
+    from ui.control_panel import ControlPanel
+    from ui.tray import DarkPauseTray
+
+    logger.info("   📁 Data dir: %s", APP_DATA_DIR)
+    logger.info("   📝 Log file: %s", log_file)
+    logger.info("   🔄 Daily reset at: %02d:00", RESET_HOUR)
 
+    # ─── Apply permanent blocks + DNS anti-bypass ───
     hosts_manager.block_permanent_domains()
     firewall_manager.block_alternative_dns()
     firewall_manager.cleanup_orphaned_allowlist()
 
-    for platform in ALL_PLATFORMS:
-        hosts_manager.block_platform(platform)
+    hosts_manager.block_platforms_bulk(ALL_PLATFORMS)
 
     # ─── Tkinter Root (hidden) ───
     root: tk.Tk = tk.Tk()
     root.withdraw()
 
     # ─── Blackout ───
-    from ui.blackout import ScreenBlackout, load_persisted_blackout
-
     blackout: ScreenBlackout = ScreenBlackout(
         root=root,
         on_complete=lambda: logger.info("🌌 Focus session completed!"),
@@ -192,7 +289,9 @@ def main() -> None:
 
     def start_blackout(minutes: int, locked: bool = False) -> None:
         """Start a blackout from any thread (schedules on main thread)."""
-        root.after(0, lambda: blackout.start(minutes, locked=locked))
+        # after_idle enqueues straight on the idle queue — no timer-heap
+        # insertion like after(0), and no lambda allocation per call.
+        root.after_idle(blackout.start, minutes, locked)
 
     # ─── Crash recovery: resume persisted blackout ───
     persisted: tuple[int, bool] | None = load_persisted_blackout()
@@ -208,8 +307,6 @@ def main() -> None:
         )
 
     # ─── Recurring Schedules ───
-    from core.scheduler import ScheduleManager
-
     scheduler: ScheduleManager = ScheduleManager(
         on_start_blackout=start_blackout,
         is_blackout_active=lambda: blackout.is_active,
@@ -221,8 +318,6 @@ def main() -> None:
 
     def open_panel() -> None:
         """Open the control panel window (create if not exists)."""
-        from ui.control_panel import ControlPanel
-
         def _open():
             try:
                 if _panel_ref[0] is None or not _panel_ref[0].winfo_exists():
@@ -239,74 +334,55 @@ def main() -> None:
             except Exception as e:
                 logger.error(f"❌ Failed to open control panel: {e}", exc_info=True)
 
-        root.after(0, _open)
-
-    # ─── System Tray (background thread) ───
-    def _flush_log() -> None:
-        """Force flush all log handlers (critical for pythonw)."""
-        for handler in logging.getLogger().handlers:
-            handler.flush()
+        root.after_idle(_open)
 
+    # ─── System Tray (pystray-managed loop) ───
     try:
-        logger.info("🔧 Importing tray module...")
-        _flush_log()
-        from ui.tray import DarkPauseTray
-
         logger.info("🔧 Creating tray icon...")
-        _flush_log()
         tray: DarkPauseTray = DarkPauseTray(
             on_open_panel=open_panel,
             on_start_blackout=start_blackout,
+            on_exit=lambda: root.after_idle(root.quit),
         )
-        logger.info("🔧 Tray icon created.")
-        _flush_log()
+        tray.run_detached()
+        logger.info("🔧 Tray icon running (detached).")
     except Exception as e:
         logger.error(f"❌ Tray initialization failed: {e}", exc_info=True)
-        _flush_log()
-
-    def run_tray() -> None:
-        """Run the tray icon in a background thread."""
-        try:
-            tray.run()
-        except Exception as e:
-            logger.error(f"Tray crashed: {e}", exc_info=True)
-            _flush_log()
-        finally:
-            root.after(0, root.quit)
-
-    tray_thread: threading.Thread = threading.Thread(
-        target=run_tray, daemon=True, name="tray",
-    )
-    tray_thread.start()
-    logger.info("🔧 Tray thread started.")
-    _flush_log()
 
     # ─── Auto-open panel on boot (skip if recovering from crash blackout) ───
     if persisted is None:
         root.after(5000, open_panel)
         logger.info("🔧 Auto-open panel scheduled (5s delay).")
-        _flush_log()
 
-    # ─── Integrity check loop (every 30s) ───
+    # ─── Integrity check loops ───
+    # The hosts verification is an os.stat plus a cached-string search,
+    # so it can stay at a tight 30s interval. The firewall check spawns
+    # netsh, which is orders of magnitude heavier and guards a rule that
+    # changes far less often — it polls on its own 5-minute cadence.
+    # %-style args here so the logging framework formats only when a
+    # handler consumes the record — these run periodically forever.
     def _integrity_check() -> None:
-        """
-        Periodic verification that protection layers are intact.
-
-        Checks:
-        1. Permanent adult content blocks in hosts file
-        2. DNS anti-bypass firewall rules
-        """
+        """Periodic check that permanent hosts blocks are intact."""
         try:
             hosts_manager.verify_permanent_blocks()
+        except Exception as e:
+            logger.error("Integrity check error: %s", e)
+        finally:
+            root.after(_INTEGRITY_CHECK_MS, _integrity_check)
+
+    def _firewall_check() -> None:
+        """Low-frequency check that the DNS anti-bypass rules are intact."""
+        try:
             if not firewall_manager.is_dns_locked():
                 logger.warning("⚠️ DNS lock was removed! Re-applying...")
                 firewall_manager.block_alternative_dns()
         except Exception as e:
-            logger.error(f"Integrity check error: {e}")
+            logger.error("Firewall check error: %s", e)
         finally:
-            root.after(_INTEGRITY_CHECK_MS, _integrity_check)
+            root.after(_FIREWALL_CHECK_MS, _firewall_check)
 
     root.after(_INTEGRITY_CHECK_MS, _integrity_check)
+    root.after(_FIREWALL_CHECK_MS, _firewall_check)
 
     logger.info("✅ All systems initialized. Entering main loop.")
     _flush_log()
@@ -317,14 +393,20 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("🛑 Interrupted by user.")
     finally:
+        # Persist any usage seconds still sitting in the write-coalescing cache
+        try:
+            from core import usage_tracker
+            usage_tracker.flush()
+        except Exception:
+            pass
+
         # Fail-safe: block everything on exit
         logger.info("🔒 Fail-safe: blocking all platforms on exit.")
 
-        for platform in ALL_PLATFORMS:
-            try:
-                hosts_manager.block_platform(platform)
-            except Exception:
-                pass
+        try:
+            hosts_manager.block_platforms_bulk(ALL_PLATFORMS)
+        except Exception:
+            pass
         try:
             hosts_manager.block_permanent_domains()
         except Exception:
@@ -339,9 +421,9 @@ def main() -> None:
         except Exception:
             pass
 
-        if _instance_socket:
+        if _instance_mutex is not None and _CloseHandle is not None:
             try:
-                _instance_socket.close()
+                _CloseHandle(_instance_mutex)
             except Exception:
                 pass
 
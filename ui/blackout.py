@@ -23,6 +23,12 @@ logger = logging.getLogger(__name__)
 _STATE_FILE: Path = APP_DATA_DIR / "blackout_state.json"
 
 
+def _block_close() -> None:
+    """Intentionally empty — prevents window destruction. Shared across
+    overlays so pool builds don't allocate a closure per window."""
+    pass
+
+
 # ─── Persistent State Helpers ───
 
 
@@ -109,11 +115,17 @@ class ScreenBlackout:
         self._root: tk.Tk = root
         self._on_complete: Optional[Callable[[], None]] = on_complete
         self._overlays: list[tk.Toplevel] = []
+        # Withdrawn Toplevels reused across sessions — built lazily on
+        # the first start() and re-shown with deiconify() after that,
+        # instead of re-creating windows and labels every blackout.
+        self._overlay_pool: list[tk.Toplevel] = []
+        self._pool_monitors: list[dict[str, int]] = []
         self._is_active: bool = False
         self._is_locked: bool = False
         self._end_time: Optional[datetime] = None
         self._timer_id: Optional[str] = None
-        self._focus_id: Optional[str] = None
+        self._safety_id: Optional[str] = None
+        self._last_displayed: tuple[int, int] | None = None
 
     @property
     def is_active(self) -> bool:
@@ -152,28 +164,96 @@ class ScreenBlackout:
         self._is_active = True
         self._is_locked = locked
         self._end_time = datetime.now() + timedelta(minutes=minutes)
-        self._overlays = []
 
-        # FIX-1: Detect monitors using existing root (no second Tk())
+        # FIX-1: Detect monitors using existing root (no second Tk()).
+        # Enumerated fresh on every start — a secondary monitor attached
+        # since the last session must get its overlay, and start() is a
+        # cold path; the expensive part (widget construction) is already
+        # amortized by the pool below.
         monitors = self._get_monitors(self._root)
+        if monitors != self._pool_monitors:
+            self._build_overlay_pool(monitors)
+
+        # Per-session state on the reused widgets
+        self._subtitle_label.configure(
+            text="🔒 LOCKED — NO ESCAPE" if locked else "FOCUS MODE",
+            fg="#2d1010" if locked else "#1a1a1a",
+        )
+        self._timer_label.configure(text="")
+        self._last_displayed = None
+
+        self._overlays = list(self._overlay_pool)
+        for overlay in self._overlays:
+            overlay.deiconify()
+            overlay.attributes("-topmost", True)
+            overlay.lift()
+
+        # Persist state for crash recovery
+        _save_blackout_state(self._end_time, minutes, locked=locked)
+
+        # Grab focus once — the FocusOut/Visibility bindings keep it
+        if self._overlays:
+            self._overlays[0].lift()
+            self._overlays[0].focus_force()
+
+        # Start timer update loop
+        self._update_timer()
+        # Low-rate safety net behind the event bindings — catches
+        # covers that never generate a FocusOut (other topmost windows)
+        self._safety_lift()
+
+    def _safety_lift(self) -> None:
+        """Re-lift all overlays every 5s as a fallback for focus theft
+        that produces no Tk event (e.g. foreign -topmost windows)."""
+        if not self._is_active:
+            return
+        for overlay in self._overlays:
+            try:
+                overlay.lift()
+                overlay.attributes("-topmost", True)
+            except Exception:
+                pass
+        self._safety_id = self._root.after(5000, self._safety_lift)
+
+    def _build_overlay_pool(self, monitors: list[dict[str, int]]) -> None:
+        """
+        (Re)create the persistent overlay pool, one window per monitor.
+
+        Toplevel construction and label packing are heavyweight Tk/Win32
+        operations; building them once and toggling deiconify/withdraw
+        per session makes start/stop near-instant. Only a monitor layout
+        change (dock/undock) forces a rebuild.
+
+        Args:
+            monitors: Monitor dicts with 'x', 'y', 'w', 'h' keys.
+        """
+        for overlay in self._overlay_pool:
+            try:
+                overlay.destroy()
+            except Exception:
+                pass
+        self._overlay_pool = []
 
         for i, mon in enumerate(monitors):
             overlay: tk.Toplevel = tk.Toplevel(self._root)
+            overlay.withdraw()
             overlay.geometry(f"{mon['w']}x{mon['h']}+{mon['x']}+{mon['y']}")
-            overlay.attributes("-topmost", True)
+            # One Tcl command per concern instead of one per option
+            overlay.wm_attributes("-topmost", True)
             overlay.overrideredirect(True)
-            overlay.configure(bg="black")
-            overlay.config(cursor="none")
+            overlay.configure(bg="black", cursor="none")
 
             # FIX-6: Properly suppress close events
-            def _block_close() -> None:
-                """Intentionally empty — prevents window destruction."""
-                pass
-
             overlay.protocol("WM_DELETE_WINDOW", _block_close)
             overlay.bind("<Alt-F4>", lambda e: "break")
 
-            # Timer label on primary monitor
+            # Event-driven focus defense: react only when the overlay
+            # actually loses focus or gets obscured, instead of a 500ms
+            # polling loop lifting every overlay all session long.
+            overlay.bind("<FocusOut>", lambda e, w=overlay: self._reassert(w))
+            overlay.bind("<Visibility>", lambda e, w=overlay: self._reassert(w))
+
+            # Timer + subtitle labels on primary monitor
             if i == 0:
                 self._timer_label = tk.Label(
                     overlay,
@@ -184,30 +264,25 @@ class ScreenBlackout:
                 )
                 self._timer_label.place(relx=0.5, rely=0.5, anchor="center")
 
-                subtitle_text: str = "🔒 LOCKED — NO ESCAPE" if locked else "FOCUS MODE"
-                subtitle_color: str = "#2d1010" if locked else "#1a1a1a"
-                subtitle = tk.Label(
+                self._subtitle_label = tk.Label(
                     overlay,
-                    text=subtitle_text,
+                    text="FOCUS MODE",
                     bg="black",
-                    fg=subtitle_color,
+                    fg="#1a1a1a",
                     font=("Segoe UI", 14),
                 )
-                subtitle.place(relx=0.5, rely=0.58, anchor="center")
+                self._subtitle_label.place(relx=0.5, rely=0.58, anchor="center")
 
-            self._overlays.append(overlay)
+            self._overlay_pool.append(overlay)
 
-        # Persist state for crash recovery
-        _save_blackout_state(self._end_time, minutes, locked=locked)
-
-        # Start timer update loop
-        self._update_timer()
-        # Start focus enforcement loop
-        self._keep_focus()
+        self._pool_monitors = monitors
 
     def stop(self, force: bool = False) -> None:
         """
-        Stop the blackout and destroy all overlays.
+        Stop the blackout and hide all overlays.
+
+        Overlays return to the withdrawn pool for the next session
+        rather than being destroyed.
 
         Args:
             force: If True, bypass Lock Mode protection (used by timer expiry only).
@@ -231,26 +306,31 @@ class ScreenBlackout:
                 pass
             self._timer_id = None
 
-        if self._focus_id:
+        if self._safety_id:
             try:
-                self._root.after_cancel(self._focus_id)
+                self._root.after_cancel(self._safety_id)
             except Exception:
                 pass
-            self._focus_id = None
+            self._safety_id = None
 
         for overlay in self._overlays:
             try:
-                overlay.destroy()
+                overlay.withdraw()
             except Exception:
                 pass
         self._overlays = []
 
     def _update_timer(self) -> None:
         """Update the countdown timer display on the overlay."""
-        if not self._is_active:
+        if not self._is_active or self._end_time is None:
             return
 
-        remaining: float = self.remaining_seconds
+        # One clock read per tick, shared by the expiry check and the
+        # label math below (the remaining_seconds property would read
+        # the clock again per access).
+        remaining: float = max(
+            0.0, (self._end_time - datetime.now()).total_seconds()
+        )
         if remaining <= 0:
             self.stop(force=True)
             if self._on_complete:
@@ -260,33 +340,39 @@ class ScreenBlackout:
         minutes: int = int(remaining // 60)
         seconds: int = int(remaining % 60)
 
-        try:
-            self._timer_label.configure(text=f"{minutes:02d}:{seconds:02d}")
-        except Exception:
-            pass
+        # Skip the Tcl configure (which triggers relayout) when the
+        # displayed MM:SS hasn't changed since the last tick.
+        if (minutes, seconds) != self._last_displayed:
+            self._last_displayed = (minutes, seconds)
+            try:
+                self._timer_label.configure(text=f"{minutes:02d}:{seconds:02d}")
+            except Exception:
+                pass
 
         self._timer_id = self._root.after(1000, self._update_timer)
 
-    def _keep_focus(self) -> None:
-        """Periodically ensure overlays stay on top of all other windows."""
-        if not self._is_active:
-            return
+    def _reassert(self, overlay: tk.Toplevel) -> None:
+        """
+        Push an overlay back on top after focus theft or occlusion.
 
-        for overlay in self._overlays:
-            try:
-                overlay.lift()
-                overlay.attributes("-topmost", True)
-            except Exception:
-                pass
+        Bound to <FocusOut> and <Visibility>, so it runs only when
+        another window actually steals focus — zero wakeups otherwise,
+        and sub-event-loop latency instead of up to 500ms.
 
-        # Also grab focus on primary overlay
-        if self._overlays:
-            try:
+        Focus always goes to the primary overlay, never the affected
+        one: on multi-monitor setups each focus_force fires <FocusOut>
+        on the previous holder, so per-overlay grabs would ping-pong
+        focus between overlays through the event queue forever.
+        """
+        if not self._is_active:
+            return
+        try:
+            overlay.lift()
+            overlay.attributes("-topmost", True)
+            if self._overlays:
                 self._overlays[0].focus_force()
-            except Exception:
-                pass
-
-        self._focus_id = self._root.after(500, self._keep_focus)
+        except Exception:
+            pass
 
     @staticmethod
     def _get_monitors(root: tk.Tk) -> list[dict[str, int]]:
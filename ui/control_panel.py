@@ -17,10 +17,12 @@ This window does NOT own the main loop — it's a Toplevel that
 can be opened and closed without killing the application.
 """
 
+import heapq
+import itertools
 import logging
 import os
+import time
 import tkinter as tk
-from datetime import datetime
 from tkinter import messagebox
 from typing import TYPE_CHECKING, Callable, Optional
 
@@ -69,6 +71,11 @@ class ControlPanel(ctk.CTkToplevel):
         self._on_start_blackout: Callable[[int, bool], None] = on_start_blackout
         self._scheduler: Optional["ScheduleManager"] = scheduler
         self._scheduled_tasks: list[dict] = []
+        # Min-heap of (trigger_ts, seq, task) mirroring the active tasks;
+        # the monitor arms one after() for the head instead of polling.
+        # seq breaks ties so equal timestamps never compare dicts.
+        self._task_heap: list[tuple[float, int, dict]] = []
+        self._task_seq = itertools.count()
         self._monitor_id: str | None = None
         self._loops_active: bool = False
 
@@ -104,7 +111,7 @@ class ControlPanel(ctk.CTkToplevel):
         self.after(200, lambda: self.wm_attributes("-toolwindow", False))
 
         self._create_ui()
-        self._start_task_monitor()
+        self._reschedule_monitor()
         self._loops_active = True
 
     # ─── UI Construction ───
@@ -230,43 +237,76 @@ class ControlPanel(ctk.CTkToplevel):
             tasks: List of task dicts to add to the queue.
         """
         self._scheduled_tasks.extend(tasks)
+        for task in tasks:
+            if task.get("active"):
+                heapq.heappush(
+                    self._task_heap,
+                    (task.get("trigger_ts", 0.0), next(self._task_seq), task),
+                )
         self._task_queue.refresh(self._scheduled_tasks)
+        self._reschedule_monitor()
 
     # ─── Task Monitor ───
 
-    def _start_task_monitor(self) -> None:
+    def _reschedule_monitor(self) -> None:
         """
-        Background loop that triggers tasks when their time is reached.
+        Arm one after() callback for the next due task, if any.
 
-        Uses timestamp comparison (>=) instead of fragile exact
-        string matching. Only runs when the panel is visible (unless
-        there are active tasks pending).
+        Instead of a 1-second polling loop scanning every task, the
+        monitor sleeps exactly until the heap head fires — zero wakeups
+        while nothing is due.
         """
-        now_ts: float = datetime.now().timestamp()
+        if self._monitor_id is not None:
+            try:
+                self.after_cancel(self._monitor_id)
+            except Exception:
+                pass
+            self._monitor_id = None
+
+        if not self._task_heap:
+            return
+
+        delay_ms: int = max(
+            0,
+            int((self._task_heap[0][0] - time.time()) * 1000),
+        )
+        # Cap the wait as a safety net against sleep/wake and clock
+        # changes (same guard the schedule checker uses): an early wake
+        # finds nothing due and simply re-arms against the wall clock.
+        self._monitor_id = self.after(min(delay_ms, 30_000), self._fire_due)
+
+    def _fire_due(self) -> None:
+        """
+        Trigger every task whose time has been reached, then re-arm.
+
+        Runs on the Tk main thread via after(), so callbacks fire
+        directly — no cross-thread marshalling needed. Popping stops at
+        the first future entry, so cost is O(log N) per fired task and
+        O(1) when woken with nothing due.
+        """
+        self._monitor_id = None
+        now_ts: float = time.time()
         any_triggered: bool = False
 
-        for task in self._scheduled_tasks:
+        while self._task_heap and self._task_heap[0][0] <= now_ts:
+            _, _, task = heapq.heappop(self._task_heap)
             if not task["active"]:
-                continue
-            trigger_ts: float = task.get("trigger_ts", 0)
-            if now_ts >= trigger_ts:
-                task["active"] = False
-                duration: int = task["duration"]
-                locked: bool = task.get("locked", False)
-                self._on_start_blackout(duration, locked)
-                any_triggered = True
-                logger.info(f"🌌 Task triggered: {duration}m blackout.")
+                continue  # Already purged/deactivated elsewhere
+            task["active"] = False
+            duration: int = task["duration"]
+            locked: bool = task.get("locked", False)
+            self._on_start_blackout(duration, locked)
+            any_triggered = True
+            logger.info(f"🌌 Task triggered: {duration}m blackout.")
 
         if any_triggered:
+            # Purge completed tasks
+            self._scheduled_tasks = [
+                t for t in self._scheduled_tasks if t["active"]
+            ]
             self._task_queue.refresh(self._scheduled_tasks)
 
-        # Purge completed tasks
-        self._scheduled_tasks = [
-            t for t in self._scheduled_tasks if t["active"]
-        ]
-
-        # Schedule next check
-        self._monitor_id = self.after(1000, self._start_task_monitor)
+        self._reschedule_monitor()
 
     # ─── Visibility ───
 
@@ -309,22 +349,22 @@ class ControlPanel(ctk.CTkToplevel):
         self.withdraw()
 
     def _resume_loops(self) -> None:
-        """Resume the task monitor loop."""
+        """Re-arm the task monitor for the next due task."""
         if self._loops_active:
             return  # Already running — avoid double-start
         self._loops_active = True
-        if self._monitor_id is None:
-            self._start_task_monitor()
+        self._reschedule_monitor()
 
     def _pause_loops(self) -> None:
-        """Pause the task monitor to save CPU when not visible."""
-        self._loops_active = False
-        has_active_tasks: bool = any(
-            t["active"] for t in self._scheduled_tasks
-        )
+        """
+        Pause the task monitor while the panel is not visible.
 
-        # Only stop monitor if no pending tasks
-        if not has_active_tasks and self._monitor_id is not None:
+        The pending after() stays armed while tasks are queued — it
+        fires at most once per due task, so keeping it costs nothing
+        and locked blackouts still trigger with the panel minimized.
+        """
+        self._loops_active = False
+        if not self._task_heap and self._monitor_id is not None:
             try:
                 self.after_cancel(self._monitor_id)
             except Exception:
@@ -278,20 +278,21 @@ class BlackoutSection(ctk.CTkFrame):
             return
 
         now: datetime = datetime.now()
-        trigger_ts: float = (now + timedelta(minutes=wait)).timestamp()
-        trigger_label: str = (now + timedelta(minutes=wait)).strftime("%H:%M")
+        trigger_dt: datetime = now + timedelta(minutes=wait)
+        trigger_ts: float = trigger_dt.timestamp()
 
         tasks: list[dict] = []
 
-        # Main blackout task
-        label: str = f"🌌 Ahora" if wait == 0 else f"⏳ {trigger_label}"
+        # Main blackout task — the HH:MM label is only formatted for
+        # delayed starts; the deadline itself stays a raw epoch float.
+        label: str = "🌌 Ahora" if wait == 0 else f"⏳ {trigger_dt.strftime('%H:%M')}"
         tasks.append({
             "type": "timer",
             "trigger_ts": trigger_ts,
             "duration": duration,
             "locked": locked,
             "active": True,
-            "label": f"{label} → {duration}m",
+            "label": f"{label} → {duration}m" + (" 🔒" if locked else ""),
         })
 
         # Optional break task (never locked)
